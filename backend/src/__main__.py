@@ -0,0 +1,56 @@
+"""
+Runnable server entrypoint: ``python -m src``.
+
+Starts uvicorn with performance-oriented defaults: the uvloop event loop
+and the httptools HTTP parser (uvicorn's "auto" mode picks both up once
+they are installed), proxy-header handling, and a configurable worker
+count.
+
+The worker count defaults to 1 because jobs, generated audio metadata,
+and runtime API-key overrides all live in process memory (see
+src/jobs/manager.py and src/config.py). Running multiple workers splits
+that state across processes, so a job created by one worker would be
+invisible to the others. Set WEB_CONCURRENCY to opt in anyway, e.g.
+behind a proxy with session affinity or once job state is externalized.
+"""
+
+import os
+
+import uvicorn
+
+from src.config import Settings
+
+
+def resolve_worker_count() -> int:
+    """
+    Resolve the uvicorn worker count from WEB_CONCURRENCY.
+
+    Returns 1 when unset or unparseable (the in-memory job store is
+    per-process; see module docstring). Values below 1 are clamped to 1.
+    """
+    raw = os.environ.get("WEB_CONCURRENCY")
+    if raw is None:
+        return 1
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        return 1
+
+
+def main() -> None:
+    """Run the FastAPI app under uvicorn."""
+    settings = Settings()
+    uvicorn.run(
+        "src.main:app",
+        host=settings.host,
+        port=settings.port,
+        workers=resolve_worker_count(),
+        loop="auto",
+        http="auto",
+        proxy_headers=True,
+        timeout_graceful_shutdown=15,
+    )
+
+
+if __name__ == "__main__":
+    main()
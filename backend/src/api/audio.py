@@ -4,39 +4,83 @@ GET /api/audio/{job_id} and GET /api/audio/{job_id}/file endpoints.
 Serves audio metadata (with timing) and the raw MP3 file.
 """
 
-from fastapi import APIRouter, Request
+import asyncio
+import hashlib
+import os
+
+from fastapi import APIRouter, Request, Response
 from fastapi.responses import FileResponse
 
 audio_router = APIRouter()
 
+# SHA-256 digests keyed by file path, validated against (size, mtime_ns)
+# so a rewritten file gets a fresh ETag. Generated MP3s are immutable, so
+# in practice each file is hashed exactly once.
+_etag_cache: dict[str, tuple[tuple[int, int], str]] = {}
+
+
+def _compute_file_digest(path: str) -> str:
+    """Hash a file's contents with hashlib.file_digest (C-speed, 64 KiB reads)."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
 
 @audio_router.get("/audio/{job_id}")
 async def get_audio_metadata(request: Request, job_id: str) -> dict:
     """
     Get audio metadata and timing data for a completed job.
 
-    Returns duration, format, size, and timing information.
+    Returns duration, format, size, and timing information. Runs in the
+    thread pool: the manager may touch the filesystem (stat, and a
+    one-time MP3 decode for jobs missing a recorded duration).
     """
     manager = request.app.state.job_manager
-    metadata = manager.get_audio_metadata(job_id)
+    metadata = await asyncio.to_thread(manager.get_audio_metadata, job_id)
     return metadata.model_dump(mode="json")
 
 
 @audio_router.get("/audio/{job_id}/file")
-async def get_audio_file(request: Request, job_id: str) -> FileResponse:
+async def get_audio_file(request: Request, job_id: str) -> Response:
     """
     Stream the actual MP3 audio file bytes.
 
-    Returns the file with appropriate Content-Type and Content-Disposition headers.
+    Returns the file with appropriate Content-Type and Content-Disposition
+    headers, plus a strong content-hash ETag so revalidating clients get a
+    zero-byte 304 instead of the full MP3. The stat and hash run in the
+    thread pool so the event loop never blocks on disk, and Starlette
+    hands the path to the ASGI server's pathsend extension (zero-copy
+    sendfile) when the server supports it.
     """
     manager = request.app.state.job_manager
     file_path = manager.get_audio_file_path(job_id)
 
+    stat_result = await asyncio.to_thread(os.stat, file_path)
+
+    signature = (stat_result.st_size, stat_result.st_mtime_ns)
+    cached = _etag_cache.get(file_path)
+    if cached is not None and cached[0] == signature:
+        digest = cached[1]
+    else:
+        digest = await asyncio.to_thread(_compute_file_digest, file_path)
+        _etag_cache[file_path] = (signature, digest)
+
+    etag = f'"{digest}"'
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    # Generated MP3s never change for a given job, so clients and any
+    # intermediary cache may keep them indefinitely; Accept-Ranges lets
+    # the <audio> element seek with byte-range requests (FileResponse
+    # honors Range since stat_result is supplied).
     return FileResponse(
         path=file_path,
         media_type="audio/mpeg",
         filename=f"tts-{job_id}.mp3",
+        stat_result=stat_result,
         headers={
             "Content-Disposition": f'attachment; filename="tts-{job_id}.mp3"',
+            "ETag": etag,
+            "Cache-Control": "public, max-age=31536000, immutable",
+            "Accept-Ranges": "bytes",
         },
     )
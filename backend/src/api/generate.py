@@ -1,25 +1,63 @@
 """
-POST /api/generate and GET /api/generate/{job_id}/status endpoints.
+POST /api/generate, GET /api/generate/{job_id}/status, and
+WS /api/generate/{job_id}/ws endpoints.
 
-Handles TTS generation job creation and status polling.
+Handles TTS generation job creation, status polling, and status push
+over WebSocket.
 """
 
 import asyncio
 import logging
 
-from fastapi import APIRouter, BackgroundTasks, Request
-
-from src.api.schemas import (
-    GenerateRequest,
-    GenerateResponse,
-    GenerationStatus,
-    JobStatusResponse,
+import orjson
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Query,
+    Request,
+    Response,
+    WebSocket,
+    WebSocketDisconnect,
 )
 
+from src.api.schemas import GenerateRequest, GenerationStatus
+from src.errors import JobNotFoundError
+
 logger = logging.getLogger(__name__)
 
 generate_router = APIRouter()
 
+# Statuses after which no further updates will be published
+_TERMINAL_STATUSES = {GenerationStatus.COMPLETED.value, GenerationStatus.FAILED.value}
+
+
+def _render_status(job) -> bytes:
+    """
+    Serialize a job's status snapshot, reusing bytes cached on the job.
+
+    The job manager bumps ``status_version`` on every mutation, so when
+    two polls see the same version the previously rendered payload is
+    returned as-is -- no dict build, no re-serialization.
+    """
+    version = job.status_version
+    cached = job.cached_status_json
+    if cached is not None and job.cached_status_version == version:
+        return cached
+
+    payload = orjson.dumps(
+        {
+            "job_id": job.id,
+            "status": job.status.value,
+            "progress": job.progress,
+            "total_chunks": job.total_chunks,
+            "completed_chunks": job.completed_chunks,
+            "error_message": job.error_message,
+        }
+    )
+    job.cached_status_json = payload
+    job.cached_status_version = version
+    return payload
+
 
 @generate_router.post("/generate", status_code=202)
 async def start_generation(
@@ -36,29 +74,82 @@ async def start_generation(
     manager = request.app.state.job_manager
     job = await manager.create_job(body)
 
-    # Schedule background processing
-    background_tasks.add_task(manager.process_job, job.id)
+    # Schedule background processing on the worker pool. Fall back to
+    # BackgroundTasks when no queue is attached (e.g., in tests that
+    # construct the app without running the lifespan).
+    job_queue = getattr(request.app.state, "job_queue", None)
+    if job_queue is not None:
+        job_queue.submit(job.id)
+    else:
+        background_tasks.add_task(manager.process_job, job.id)
 
-    resp = GenerateResponse(job_id=job.id, status=job.status)
-    return resp.model_dump(mode="json")
+    # Shape matches GenerateResponse; built directly to skip model
+    # construction on this hot path.
+    return {"job_id": job.id, "status": job.status.value}
 
 
 @generate_router.get("/generate/{job_id}/status")
-async def get_job_status(request: Request, job_id: str) -> dict:
+async def get_job_status(
+    request: Request,
+    job_id: str,
+    wait: float = Query(default=0.0, ge=0.0, le=30.0),
+) -> Response:
     """
     Poll for generation job progress.
 
     Returns the current status, progress, and any error message.
+
+    With ?wait=<seconds> (long polling), the server holds the request
+    open until the status changes or the wait elapses, then responds
+    with the latest state. This cuts the number of round trips compared
+    to fixed-interval polling.
     """
     manager = request.app.state.job_manager
     job = manager.get_job_status(job_id)
 
-    resp = JobStatusResponse(
-        job_id=job.id,
-        status=job.status,
-        progress=job.progress,
-        total_chunks=job.total_chunks,
-        completed_chunks=job.completed_chunks,
-        error_message=job.error_message,
-    )
-    return resp.model_dump(mode="json")
+    if wait > 0 and job.status.value not in _TERMINAL_STATUSES:
+        queue = manager.subscribe(job_id)
+        try:
+            await asyncio.wait_for(queue.get(), timeout=wait)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            manager.unsubscribe(job_id, queue)
+        job = manager.get_job_status(job_id)
+
+    # Shape matches JobStatusResponse; rendered once per state change and
+    # served from the per-job bytes cache on steady-state polls.
+    return Response(content=_render_status(job), media_type="application/json")
+
+
+@generate_router.websocket("/generate/{job_id}/ws")
+async def job_status_ws(websocket: WebSocket, job_id: str) -> None:
+    """
+    Push job status transitions over a WebSocket.
+
+    Sends the current status immediately on connect, then one message per
+    state change until the job reaches a terminal status. Avoids the
+    serialization and connection overhead of repeated polling.
+    """
+    manager = websocket.app.state.job_manager
+
+    try:
+        job = manager.get_job_status(job_id)
+    except JobNotFoundError:
+        # 1008 = policy violation; closest code for "unknown resource"
+        await websocket.close(code=1008, reason=f"Job '{job_id}' not found")
+        return
+
+    await websocket.accept()
+    queue = manager.subscribe(job_id)
+    try:
+        snapshot = manager.status_snapshot(job)
+        await websocket.send_json(snapshot)
+        while snapshot["status"] not in _TERMINAL_STATUSES:
+            snapshot = await queue.get()
+            await websocket.send_json(snapshot)
+        await websocket.close()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        manager.unsubscribe(job_id, queue)
@@ -5,7 +5,9 @@ Returns application health status including version and dependency checks.
 Used by Docker health checks and monitoring.
 """
 
+import asyncio
 import shutil
+import time
 
 from fastapi import APIRouter
 
@@ -15,14 +17,44 @@ health_router = APIRouter()
 # Instead, we use the version from the package metadata or a constant.
 APP_VERSION = "0.1.0"
 
+# How long a PATH lookup result stays valid. Docker health checks hit this
+# endpoint every 30s; ffmpeg availability essentially never changes at runtime.
+FFMPEG_CHECK_TTL_SECONDS = 30.0
+
+_ffmpeg_cache: tuple[float, dict] | None = None
+
+
+def _get_cached_ffmpeg() -> dict | None:
+    """Return the cached ffmpeg check result, or None if stale/missing."""
+    if (
+        _ffmpeg_cache is not None
+        and time.monotonic() - _ffmpeg_cache[0] < FFMPEG_CHECK_TTL_SECONDS
+    ):
+        return _ffmpeg_cache[1]
+    return None
+
 
 def _check_ffmpeg() -> dict:
-    """Check if ffmpeg is available on the system PATH."""
+    """
+    Check if ffmpeg is available on the system PATH.
+
+    The result is cached for FFMPEG_CHECK_TTL_SECONDS to avoid scanning
+    PATH directories on every health probe.
+    """
+    global _ffmpeg_cache
+
+    cached = _get_cached_ffmpeg()
+    if cached is not None:
+        return cached
+
+    now = time.monotonic()
     ffmpeg_path = shutil.which("ffmpeg")
-    return {
+    result = {
         "available": ffmpeg_path is not None,
         "path": ffmpeg_path,
     }
+    _ffmpeg_cache = (now, result)
+    return result
 
 
 @health_router.get("/health")
@@ -35,7 +67,11 @@ async def health_check() -> dict:
         - version: application version string
         - dependencies.ffmpeg: whether ffmpeg is installed and reachable
     """
-    ffmpeg_status = _check_ffmpeg()
+    # Serve from cache when fresh; otherwise run the PATH scan in the
+    # thread pool so it never blocks the event loop.
+    ffmpeg_status = _get_cached_ffmpeg()
+    if ffmpeg_status is None:
+        ffmpeg_status = await asyncio.to_thread(_check_ffmpeg)
 
     # Overall status: degraded if ffmpeg is missing (audio processing will fail)
     overall_status = "healthy" if ffmpeg_status["available"] else "degraded"
@@ -4,19 +4,46 @@ GET /api/providers endpoint.
 Lists all registered TTS providers with capabilities and configuration status.
 """
 
-from fastapi import APIRouter, Request
+import orjson
+from fastapi import APIRouter, Request, Response
 
 from src.api.schemas import ProviderInfo
 
 providers_router = APIRouter()
 
+# Cached (registry, config, config_version, body_bytes); provider metadata
+# only changes when an API key is added or removed at runtime.
+_providers_cache: tuple | None = None
+
 
 @providers_router.get("/providers")
-async def list_providers(request: Request) -> dict:
+async def list_providers(request: Request) -> Response:
     """
     List all registered TTS providers with their capabilities and
     configuration status.
+
+    The response is rendered to bytes once per runtime-config version, so
+    repeated requests skip the registry walk, the per-provider model
+    dumps, and JSON encoding entirely.
     """
+    global _providers_cache
+
     registry = request.app.state.provider_registry
-    providers: list[ProviderInfo] = registry.list_providers()
-    return {"providers": [p.model_dump(mode="json") for p in providers]}
+    config = getattr(request.app.state, "runtime_config", None)
+    version = getattr(config, "version", None)
+
+    if (
+        _providers_cache is not None
+        and _providers_cache[0] is registry
+        and _providers_cache[1] is config
+        and _providers_cache[2] == version
+    ):
+        body = _providers_cache[3]
+    else:
+        providers: list[ProviderInfo] = registry.list_providers()
+        body = orjson.dumps(
+            {"providers": [p.model_dump(mode="json") for p in providers]}
+        )
+        _providers_cache = (registry, config, version, body)
+
+    return Response(content=body, media_type="application/json")
@@ -7,7 +7,7 @@ and are used for validation, serialization, and documentation.
 
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 # --- Provider Models ---
@@ -21,6 +21,21 @@ class ProviderName(str, Enum):
     ELEVENLABS = "elevenlabs"
     OPENAI = "openai"
 
+    @classmethod
+    def _missing_(cls, value: object) -> "ProviderName | None":
+        # Fallback for case-variant input ("Google", "OPENAI"): one dict
+        # probe against a precomputed lowercase map instead of the enum
+        # default of scanning every member before raising.
+        if isinstance(value, str):
+            return _PROVIDER_NAME_BY_LOWER.get(value.lower())
+        return None
+
+
+# Built once at import; canonical values are already lowercase.
+_PROVIDER_NAME_BY_LOWER: dict[str, "ProviderName"] = {
+    member.value: member for member in ProviderName
+}
+
 
 class ProviderCapabilities(BaseModel):
     """Describes what features a provider supports. (FR-013)"""
@@ -31,6 +46,9 @@ class ProviderCapabilities(BaseModel):
     max_speed: float = 4.0
     default_speed: float = 1.0
     max_chunk_chars: int = 5000
+    # How many synthesis calls the job manager may have in flight at
+    # once; sized conservatively against provider rate limits.
+    concurrency: int = 4
 
 
 class ProviderInfo(BaseModel):
@@ -83,6 +101,16 @@ class GenerateRequest(BaseModel):
     text: str = Field(..., min_length=1, max_length=100_000)
     speed: float = Field(default=1.0, ge=0.25, le=4.0)
 
+    @field_validator("text")
+    @classmethod
+    def _text_not_blank(cls, value: str) -> str:
+        # Checked here, during the single parse pass, so whitespace-only
+        # input fails validation (422) instead of raising deep inside job
+        # creation when the chunker rejects it.
+        if value.isspace():
+            raise ValueError("text must contain non-whitespace characters")
+        return value
+
 
 class GenerateResponse(BaseModel):
     """Immediate response after accepting a generation job."""
@@ -16,6 +16,18 @@ from src.api.schemas import (
 
 settings_router = APIRouter()
 
+# All providers, in display order. Computed once at import time.
+_ALL_PROVIDERS: tuple[ProviderName, ...] = (
+    ProviderName.GOOGLE,
+    ProviderName.AMAZON,
+    ProviderName.ELEVENLABS,
+    ProviderName.OPENAI,
+)
+
+# Cached (config, config_version, payload); invalidated when a key is
+# updated (the runtime config bumps its version).
+_settings_cache: tuple | None = None
+
 
 @settings_router.get("/settings")
 async def get_settings(request: Request) -> dict:
@@ -24,25 +36,34 @@ async def get_settings(request: Request) -> dict:
 
     Returns is_configured status for each provider. NEVER returns
     actual API key values.
+
+    The response is cached per runtime-config version and rebuilt only
+    after a key update.
     """
+    global _settings_cache
+
     config = request.app.state.runtime_config
-    provider_names = [
-        ProviderName.GOOGLE,
-        ProviderName.AMAZON,
-        ProviderName.ELEVENLABS,
-        ProviderName.OPENAI,
-    ]
+    version = getattr(config, "version", None)
+
+    if (
+        _settings_cache is not None
+        and _settings_cache[0] is config
+        and _settings_cache[1] == version
+    ):
+        return _settings_cache[2]
 
     statuses = [
         ProviderKeyStatus(
             provider=name,
             is_configured=config.is_provider_configured(name),
         )
-        for name in provider_names
+        for name in _ALL_PROVIDERS
     ]
 
     resp = SettingsResponse(providers=statuses)
-    return resp.model_dump(mode="json")
+    payload = resp.model_dump(mode="json")
+    _settings_cache = (config, version, payload)
+    return payload
 
 
 @settings_router.put("/settings")
@@ -56,6 +77,12 @@ async def update_settings(request: Request, body: UpdateSettingsRequest) -> dict
     config = request.app.state.runtime_config
     config.set_provider_key(body.provider, body.api_key)
 
+    # A key change flips is_configured; drop the registry's memoized
+    # provider list so /api/providers reflects it.
+    registry = getattr(request.app.state, "provider_registry", None)
+    if registry is not None:
+        registry.invalidate()
+
     return ProviderKeyStatus(
         provider=body.provider,
         is_configured=True,
@@ -5,18 +5,30 @@ Fetches available voices for a specific provider.
 """
 
 from fastapi import APIRouter, Request
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 
-from src.api.schemas import ProviderName, VoiceListResponse
+from src.api.schemas import ProviderName
 from src.errors import ProviderNotConfiguredError, ProviderNotFoundError
 
 voices_router = APIRouter()
 
 
 class VoiceRequest(BaseModel):
-    """Request body for the voices endpoint. Accepts a string provider name."""
+    """Request body for the voices endpoint."""
 
-    provider: str
+    provider: ProviderName
+
+    @field_validator("provider", mode="before")
+    @classmethod
+    def _known_provider(cls, value: object) -> ProviderName:
+        # Coerce once here so an unknown provider surfaces as the API's
+        # 400 INVALID_PROVIDER error rather than a generic 422.
+        # ProviderNotFoundError is not a ValueError, so it escapes
+        # validation and reaches the app's TTSError handler.
+        try:
+            return ProviderName(value)
+        except ValueError:
+            raise ProviderNotFoundError(str(value)) from None
 
 
 @voices_router.post("/voices")
@@ -31,18 +43,20 @@ async def list_voices(request: Request, body: VoiceRequest) -> dict:
     """
     registry = request.app.state.provider_registry
 
-    # Validate provider name and look it up in registry
-    try:
-        provider_name = ProviderName(body.provider)
-    except ValueError:
-        raise ProviderNotFoundError(body.provider)
-
+    # body.provider is already a ProviderName; validation happened once
+    # in the model, so look it up in the registry directly.
+    provider_name = body.provider
     provider = registry.get(provider_name)
 
     if not provider.is_configured():
-        raise ProviderNotConfiguredError(body.provider)
+        raise ProviderNotConfiguredError(provider_name.value)
 
     voices = await provider.list_voices()
 
-    resp = VoiceListResponse(provider=provider_name, voices=voices)
-    return resp.model_dump(mode="json")
+    # Serialize the Voice models directly. Wrapping them in a
+    # VoiceListResponse would re-validate every entry just to dump the
+    # same data again (hundreds of voices for Google/Polly).
+    return {
+        "provider": provider_name.value,
+        "voices": [v.model_dump(mode="json") for v in voices],
+    }
@@ -10,6 +10,15 @@ from pydantic_settings import BaseSettings
 
 from src.api.schemas import ProviderName
 
+# Maps each provider to the RuntimeConfig override field its API key
+# lives in. Built once at import time instead of per call.
+PROVIDER_KEY_FIELDS: dict[ProviderName, str] = {
+    ProviderName.GOOGLE: "google_api_key",
+    ProviderName.AMAZON: "aws_access_key_id",
+    ProviderName.ELEVENLABS: "elevenlabs_api_key",
+    ProviderName.OPENAI: "openai_api_key",
+}
+
 
 class Settings(BaseSettings):
     """
@@ -25,6 +34,9 @@ class Settings(BaseSettings):
     # Audio storage
     audio_storage_dir: str = "/tmp/tts-app-audio"
 
+    # Job processing
+    job_queue_workers: int = 2
+
     # Google Cloud TTS
     google_credentials_path: str | None = Field(
         default=None,
@@ -64,6 +76,21 @@ class RuntimeConfig:
     def __init__(self, settings: Settings) -> None:
         self._base = settings
         self._overrides: dict[str, str] = {}
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """
+        Monotonic counter bumped on every runtime change.
+
+        Lets response caches (e.g., /api/providers, /api/settings) detect
+        when configuration-derived payloads are stale.
+        """
+        return self._version
+
+    def get_audio_storage_dir(self) -> str:
+        """Get the audio storage directory (also hosts on-disk caches)."""
+        return self._base.audio_storage_dir
 
     def get_google_credentials_path(self) -> str | None:
         """Get the Google Cloud credentials file path."""
@@ -99,25 +126,21 @@ class RuntimeConfig:
 
         This does NOT persist to disk -- it is session-only.
         """
-        key_map: dict[ProviderName, str] = {
-            ProviderName.GOOGLE: "google_api_key",
-            ProviderName.AMAZON: "aws_access_key_id",
-            ProviderName.ELEVENLABS: "elevenlabs_api_key",
-            ProviderName.OPENAI: "openai_api_key",
-        }
-        field = key_map.get(provider)
+        field = PROVIDER_KEY_FIELDS.get(provider)
         if field:
             self._overrides[field] = key
+            self._version += 1
 
     def is_provider_configured(self, provider: ProviderName) -> bool:
         """Check if a provider has credentials set."""
-        checkers: dict[ProviderName, callable] = {
-            ProviderName.GOOGLE: lambda: bool(self.get_google_credentials_path() or self.get_google_api_key()),
-            ProviderName.AMAZON: lambda: bool(
-                self.get_aws_access_key_id() and self.get_aws_secret_access_key()
-            ),
-            ProviderName.ELEVENLABS: lambda: bool(self.get_elevenlabs_api_key()),
-            ProviderName.OPENAI: lambda: bool(self.get_openai_api_key()),
-        }
-        checker = checkers.get(provider)
-        return checker() if checker else False
+        # Identity dispatch on enum singletons: no dict or lambda
+        # allocations on a path hit four times per /settings request.
+        if provider is ProviderName.GOOGLE:
+            return bool(self.get_google_credentials_path() or self.get_google_api_key())
+        if provider is ProviderName.AMAZON:
+            return bool(self.get_aws_access_key_id() and self.get_aws_secret_access_key())
+        if provider is ProviderName.ELEVENLABS:
+            return bool(self.get_elevenlabs_api_key())
+        if provider is ProviderName.OPENAI:
+            return bool(self.get_openai_api_key())
+        return False
@@ -7,6 +7,8 @@ catches AppError and returns structured JSON responses.
 
 import re
 
+import orjson
+
 
 class AppError(Exception):
     """
@@ -121,13 +123,16 @@ class ProviderAPIError(ProviderError):
 class ProviderRateLimitError(ProviderError):
     """Provider rate limit exceeded."""
 
-    def __init__(self, provider: str) -> None:
+    def __init__(self, provider: str, retry_after: float | None = None) -> None:
         super().__init__(
             message=f"Rate limit exceeded for provider '{provider}'. Please wait and try again.",
             error_code="PROVIDER_RATE_LIMIT",
             http_status=429,
             details={"provider": provider},
         )
+        # Server-suggested wait in seconds (from a Retry-After header),
+        # honored by the retry backoff in the job manager.
+        self.retry_after = retry_after
 
 
 # --- Job Errors ---
@@ -174,8 +179,25 @@ class AudioProcessingError(AppError):
         )
 
 
+# Canonical 500 payload, serialized once at import time. The unhandled-error
+# paths (exception handler and catch-all middleware) send these bytes
+# directly instead of re-encoding the same dict per failure.
+INTERNAL_ERROR_BODY = orjson.dumps(
+    {
+        "error_code": "INTERNAL_ERROR",
+        "message": "An unexpected error occurred",
+        "details": None,
+    }
+)
+
+
 # --- Sanitization ---
 
+# Compiled once at import time; sanitize_provider_error runs on every
+# provider failure and on each error response.
+_KEY_PATTERN = re.compile(r"[A-Za-z0-9_\-]{20,}")
+_URL_PATTERN = re.compile(r"https?://\S+")
+
 
 def sanitize_provider_error(raw_message: str) -> str:
     """
@@ -184,6 +206,6 @@ def sanitize_provider_error(raw_message: str) -> str:
     Strips anything that looks like an API key (20+ alphanumeric characters)
     and URLs with query parameters.
     """
-    sanitized = re.sub(r"[A-Za-z0-9_\-]{20,}", "[REDACTED]", raw_message)
-    sanitized = re.sub(r"https?://\S+", "[URL REDACTED]", sanitized)
+    sanitized = _KEY_PATTERN.sub("[REDACTED]", raw_message)
+    sanitized = _URL_PATTERN.sub("[URL REDACTED]", sanitized)
     return sanitized
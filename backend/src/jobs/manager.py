@@ -6,9 +6,14 @@ and progress tracking.
 """
 
 import asyncio
+import bisect
+import hashlib
 import logging
 import os
-import uuid
+import random
+import shutil
+import time
+from secrets import token_hex
 from datetime import datetime, timedelta, timezone
 
 from src.api.schemas import (
@@ -33,8 +38,32 @@ from src.providers.registry import ProviderRegistry
 
 logger = logging.getLogger(__name__)
 
+
+def _utcnow() -> datetime:
+    """Aware UTC now; bound here so call sites skip the tz plumbing."""
+    return datetime.now(timezone.utc)
+
+
+def _new_job_id() -> str:
+    """
+    Generate a time-sortable 32-char hex job ID (UUIDv7-style layout).
+
+    The first 12 hex digits encode the creation time in milliseconds, the
+    remaining 20 are random. IDs therefore sort chronologically, which
+    keeps log output and directory listings in creation order, while the
+    80 random bits keep them unguessable.
+    """
+    return f"{time.time_ns() // 1_000_000:012x}{token_hex(10)}"
+
+
 MAX_RETRIES = 3
 INITIAL_BACKOFF_SECONDS = 1.0
+MAX_BACKOFF_SECONDS = 30.0
+
+# Minimum interval between intermediate progress flushes during chunk
+# synthesis. Progress changes faster than any poller can observe; one
+# store update + subscriber publish per interval is plenty.
+PROGRESS_FLUSH_INTERVAL_S = 0.1
 
 
 async def synthesize_with_retry(
@@ -46,18 +75,23 @@ async def synthesize_with_retry(
     """
     Call provider.synthesize with retry on rate limit errors.
 
-    Only retries ProviderRateLimitError. All other errors propagate immediately.
+    Only retries ProviderRateLimitError. All other errors propagate
+    immediately. The delay honors the provider's Retry-After hint when
+    one was sent, otherwise backs off exponentially; either way it is
+    jittered so concurrent chunk retries don't re-hit the limit in
+    lockstep, and capped at MAX_BACKOFF_SECONDS.
     """
     from src.providers.base import SynthesisResult
 
     for attempt in range(MAX_RETRIES + 1):
         try:
             return await provider.synthesize(text, voice_id, speed)
-        except ProviderRateLimitError:
+        except ProviderRateLimitError as exc:
             if attempt == MAX_RETRIES:
                 raise
-            backoff = INITIAL_BACKOFF_SECONDS * (2 ** attempt)
-            await asyncio.sleep(backoff)
+            base = exc.retry_after or INITIAL_BACKOFF_SECONDS * (2 ** attempt)
+            delay = min(MAX_BACKOFF_SECONDS, random.uniform(base * 0.5, base * 1.5))
+            await asyncio.sleep(delay)
 
 
 class JobStore:
@@ -70,10 +104,18 @@ class JobStore:
 
     def __init__(self) -> None:
         self._jobs: dict[str, GenerationJob] = {}
+        # (created_at, job_id) kept sorted so cleanup only touches the
+        # expired prefix instead of scanning every job.
+        self._by_time: list[tuple[datetime, str]] = []
 
     def create(self, job: GenerationJob) -> None:
         """Store a new job."""
+        # Normalize to aware UTC once at insertion (tests and legacy
+        # callers pass naive datetimes) so cleanup never re-checks tzinfo.
+        if job.created_at.tzinfo is None:
+            job.created_at = job.created_at.replace(tzinfo=timezone.utc)
         self._jobs[job.id] = job
+        bisect.insort(self._by_time, (job.created_at, job.id))
 
     def get(self, job_id: str) -> GenerationJob:
         """
@@ -101,18 +143,16 @@ class JobStore:
 
         Returns the number of jobs removed.
         """
-        cutoff = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
-        to_remove = []
-        for job_id, job in self._jobs.items():
-            created = job.created_at
-            # Handle naive datetimes (from tests or legacy code)
-            if created.tzinfo is None:
-                created = created.replace(tzinfo=timezone.utc)
-            if created < cutoff:
-                to_remove.append(job_id)
-        for job_id in to_remove:
-            del self._jobs[job_id]
-        return len(to_remove)
+        cutoff = _utcnow() - timedelta(hours=max_age_hours)
+        index = bisect.bisect_left(self._by_time, (cutoff, ""))
+        expired = self._by_time[:index]
+        del self._by_time[:index]
+
+        removed = 0
+        for _, job_id in expired:
+            if self._jobs.pop(job_id, None) is not None:
+                removed += 1
+        return removed
 
 
 class JobManager:
@@ -143,6 +183,14 @@ class JobManager:
         self._stitcher = audio_stitcher
         self._job_store = job_store
         self._audio_dir = audio_storage_dir
+        # Status subscribers per job (for WebSocket push), keyed by job ID
+        self._subscribers: dict[str, list[asyncio.Queue]] = {}
+        # One synthesis semaphore per provider, shared by ALL jobs. A job
+        # arriving while another is in flight draws chunks from the same
+        # pooled budget instead of doubling the provider's concurrency,
+        # and its chunks start as soon as slots free up rather than after
+        # the earlier job finishes.
+        self._synthesis_slots: dict = {}
 
     async def create_job(self, request: GenerateRequest) -> GenerationJob:
         """
@@ -162,7 +210,7 @@ class JobManager:
 
         # Create job
         job = GenerationJob(
-            id=str(uuid.uuid4()),
+            id=_new_job_id(),
             provider=request.provider,
             voice_id=request.voice_id,
             text=request.text,
@@ -174,13 +222,147 @@ class JobManager:
             audio_file_path=None,
             timing_data=None,
             error_message=None,
-            created_at=datetime.now(timezone.utc),
+            created_at=_utcnow(),
             completed_at=None,
+            chunks=chunks,
         )
 
         self._job_store.create(job)
         return job
 
+    def _synthesis_semaphore(self, provider_name, concurrency: int) -> asyncio.Semaphore:
+        """Get the provider-wide chunk-synthesis semaphore, creating it lazily."""
+        sem = self._synthesis_slots.get(provider_name)
+        if sem is None:
+            sem = asyncio.Semaphore(max(1, concurrency))
+            self._synthesis_slots[provider_name] = sem
+        return sem
+
+    def status_snapshot(self, job: GenerationJob) -> dict:
+        """
+        Build a JSON-serializable status snapshot for a job.
+
+        Shape matches JobStatusResponse; built directly because snapshots
+        are produced on every state transition.
+        """
+        return {
+            "job_id": job.id,
+            "status": job.status.value,
+            "progress": job.progress,
+            "total_chunks": job.total_chunks,
+            "completed_chunks": job.completed_chunks,
+            "error_message": job.error_message,
+        }
+
+    def subscribe(self, job_id: str) -> asyncio.Queue:
+        """
+        Subscribe to status updates for a job.
+
+        Returns an asyncio.Queue that receives a status snapshot dict on
+        every state transition. Callers must unsubscribe when done.
+
+        Raises:
+            JobNotFoundError: If the job does not exist.
+        """
+        self._job_store.get(job_id)  # validate job exists
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.setdefault(job_id, []).append(queue)
+        return queue
+
+    def unsubscribe(self, job_id: str, queue: asyncio.Queue) -> None:
+        """Remove a subscriber queue for a job."""
+        subscribers = self._subscribers.get(job_id)
+        if subscribers is None:
+            return
+        try:
+            subscribers.remove(queue)
+        except ValueError:
+            pass
+        if not subscribers:
+            del self._subscribers[job_id]
+
+    def _publish(self, job: GenerationJob) -> None:
+        """Push a status snapshot to all subscribers of a job."""
+        subscribers = self._subscribers.get(job.id)
+        if not subscribers:
+            return
+        snapshot = self.status_snapshot(job)
+        for queue in subscribers:
+            queue.put_nowait(snapshot)
+
+    def _update_job(self, job: GenerationJob) -> None:
+        """Update the job in the store and notify subscribers."""
+        job.status_version += 1
+        self._job_store.update(job)
+        self._publish(job)
+
+    # ── Content-addressed audio cache ───────────────────────────────
+
+    def _cache_paths(self, job: GenerationJob) -> tuple[str, str]:
+        """
+        Compute the cache file paths (audio, timing) for a job's inputs.
+
+        The key is SHA-256 over provider, voice, speed, and text, so
+        identical requests hit the same cache entry.
+        """
+        hasher = hashlib.sha256()
+        hasher.update(
+            f"{job.provider.value}\x00{job.voice_id}\x00{job.speed}\x00".encode("utf-8")
+        )
+        hasher.update(job.text.encode("utf-8"))
+        key = hasher.hexdigest()
+        cache_dir = os.path.join(self._audio_dir, "cache")
+        return (
+            os.path.join(cache_dir, f"{key}.mp3"),
+            os.path.join(cache_dir, f"{key}.json"),
+        )
+
+    def _try_complete_from_cache(self, job: GenerationJob) -> bool:
+        """
+        Complete a job from cached audio if an entry exists.
+
+        Returns True on a cache hit (job marked COMPLETED), False otherwise.
+        Cache read errors are logged and treated as a miss.
+        """
+        audio_cache_path, timing_cache_path = self._cache_paths(job)
+        if not (os.path.isfile(audio_cache_path) and os.path.isfile(timing_cache_path)):
+            return False
+
+        try:
+            with open(timing_cache_path, "r", encoding="utf-8") as f:
+                timing_data = TimingData.model_validate_json(f.read())
+
+            os.makedirs(self._audio_dir, exist_ok=True)
+            audio_path = os.path.join(self._audio_dir, f"{job.id}.mp3")
+            shutil.copyfile(audio_cache_path, audio_path)
+        except Exception as exc:
+            logger.warning("Audio cache read failed, regenerating: %s", exc)
+            return False
+
+        job.audio_file_path = os.path.abspath(audio_path)
+        job.timing_data = timing_data
+        job.status = GenerationStatus.COMPLETED
+        job.progress = 1.0
+        job.completed_chunks = job.total_chunks
+        job.completed_at = _utcnow()
+        self._update_job(job)
+        logger.info("Job %s served from audio cache", job.id)
+        return True
+
+    def _store_in_cache(self, job: GenerationJob, timing_data: TimingData) -> None:
+        """
+        Store a completed job's audio and timing in the cache. Best-effort:
+        failures are logged but never fail the job.
+        """
+        audio_cache_path, timing_cache_path = self._cache_paths(job)
+        try:
+            os.makedirs(os.path.dirname(audio_cache_path), exist_ok=True)
+            shutil.copyfile(job.audio_file_path, audio_cache_path)
+            with open(timing_cache_path, "w", encoding="utf-8") as f:
+                f.write(timing_data.model_dump_json())
+        except Exception as exc:
+            logger.warning("Audio cache write failed: %s", exc)
+
     async def process_job(self, job_id: str) -> None:
         """
         Process a generation job (runs as a background task).
@@ -191,65 +373,101 @@ class JobManager:
 
         try:
             job.status = GenerationStatus.IN_PROGRESS
-            self._job_store.update(job)
+            self._update_job(job)
+
+            # Identical past requests are served straight from the cache
+            if self._try_complete_from_cache(job):
+                return
 
             provider = self._registry.get(job.provider)
             caps = provider.get_capabilities()
-            chunks = self._chunker.chunk(job.text, caps.max_chunk_chars)
+            # Reuse the chunk plan from create_job; re-chunk only for jobs
+            # created without one (e.g., constructed directly in tests).
+            chunks = job.chunks or self._chunker.chunk(job.text, caps.max_chunk_chars)
 
             job.total_chunks = len(chunks)
-            self._job_store.update(job)
+            self._update_job(job)
+
+            # Synthesize chunks concurrently: the work is pure network I/O,
+            # so dispatching all chunks at once (bounded by the provider's
+            # concurrency quota) cuts job latency from N round trips to
+            # roughly N / concurrency. Progress updates still stream as
+            # individual chunks finish; gather preserves input order.
+            # The semaphore is shared across jobs, so overlapping jobs on
+            # the same provider pool their chunks under one budget.
+            semaphore = self._synthesis_semaphore(job.provider, caps.concurrency)
+            last_flush = time.monotonic()
+
+            async def synth_one(chunk):
+                nonlocal last_flush
+                async with semaphore:
+                    result = await synthesize_with_retry(
+                        provider, chunk.text, job.voice_id, job.speed
+                    )
+                job.completed_chunks += 1
+                job.progress = job.completed_chunks / job.total_chunks
+                # Coalesce progress writes: the store holds this same job
+                # object, so readers always see fresh counters; flushing
+                # (version bump + subscriber publish) is throttled to one
+                # per interval, plus a guaranteed flush on the last chunk.
+                now = time.monotonic()
+                if (
+                    now - last_flush >= PROGRESS_FLUSH_INTERVAL_S
+                    or job.completed_chunks == job.total_chunks
+                ):
+                    self._update_job(job)
+                    last_flush = now
+                return result
+
+            tasks = [asyncio.create_task(synth_one(c)) for c in chunks]
+            try:
+                results = await asyncio.gather(*tasks)
+            except Exception:
+                # First failure fails the job; stop the in-flight siblings
+                # so they don't keep mutating it afterwards.
+                for task in tasks:
+                    task.cancel()
+                raise
 
             audio_parts: list[bytes] = []
-            word_timing_parts: list[list] = []
-            sentence_timing_parts: list[list] = []
             durations: list[int] = []
-            has_word_timings = False
-            has_sentence_timings = False
-
-            for chunk in chunks:
-                result = await synthesize_with_retry(
-                    provider, chunk.text, job.voice_id, job.speed
-                )
+            # Timing parts indexed by chunk position; None marks a chunk
+            # the provider returned no timing for. The merge step skips
+            # None entries, so no placeholder lists are allocated and
+            # "any timing at all?" is a single any() at the merge site.
+            word_timing_parts: list[list | None] = [None] * len(results)
+            sentence_timing_parts: list[list | None] = [None] * len(results)
+
+            for i, result in enumerate(results):
                 audio_parts.append(result.audio_bytes)
                 durations.append(result.duration_ms)
-
                 if result.word_timings:
-                    word_timing_parts.append(result.word_timings)
-                    has_word_timings = True
-                else:
-                    word_timing_parts.append([])
-
+                    word_timing_parts[i] = result.word_timings
                 if result.sentence_timings:
-                    sentence_timing_parts.append(result.sentence_timings)
-                    has_sentence_timings = True
-                else:
-                    sentence_timing_parts.append([])
+                    sentence_timing_parts[i] = result.sentence_timings
 
-                job.completed_chunks += 1
-                job.progress = job.completed_chunks / job.total_chunks
-                self._job_store.update(job)
-
-            # Stitch audio
-            final_audio = self._stitcher.stitch(audio_parts)
-
-            # Save to disk
+            # Stitch and encode straight to disk; the final MP3 never
+            # lives in memory, and the per-chunk parts can be dropped.
+            # Decoding/encoding is CPU plus blocking file I/O, so it runs
+            # in the thread pool instead of stalling the event loop.
             os.makedirs(self._audio_dir, exist_ok=True)
             audio_path = os.path.join(self._audio_dir, f"{job.id}.mp3")
-            with open(audio_path, "wb") as f:
-                f.write(final_audio.audio_bytes)
+            final_audio = await asyncio.to_thread(
+                self._stitcher.stitch_to_file, audio_parts, audio_path
+            )
+            del audio_parts
 
             # Merge timing data, accounting for silence gaps between chunks
             silence_ms = self._stitcher.silence_between_ms
             try:
-                if has_word_timings:
+                if any(w is not None for w in word_timing_parts):
                     merged_words = self._timing_normalizer.merge_word_timings(
                         chunks, word_timing_parts, durations, silence_ms
                     )
                     timing_data = TimingData(
                         timing_type="word", words=merged_words, sentences=None
                     )
-                elif has_sentence_timings:
+                elif any(s is not None for s in sentence_timing_parts):
                     merged_sentences = self._timing_normalizer.merge_sentence_timings(
                         chunks, sentence_timing_parts, durations, silence_ms
                     )
@@ -275,15 +493,18 @@ class JobManager:
 
             job.audio_file_path = os.path.abspath(audio_path)
             job.timing_data = timing_data
+            job.duration_ms = final_audio.duration_ms
             job.status = GenerationStatus.COMPLETED
             job.progress = 1.0
-            job.completed_at = datetime.now(timezone.utc)
-            self._job_store.update(job)
+            job.completed_at = _utcnow()
+            self._update_job(job)
+
+            self._store_in_cache(job, timing_data)
 
         except Exception as exc:
             job.status = GenerationStatus.FAILED
             job.error_message = sanitize_provider_error(str(exc))
-            self._job_store.update(job)
+            self._update_job(job)
             logger.exception("Job %s failed: %s", job_id, exc)
 
     def get_job_status(self, job_id: str) -> GenerationJob:
@@ -322,16 +543,20 @@ class JobManager:
         if job.status != GenerationStatus.COMPLETED:
             raise JobNotCompletedError(job_id, job.status.value)
 
-        # Get file size
+        # Get file size; duration was recorded at completion, so the MP3
+        # only has to be re-decoded for jobs that don't carry it (e.g.,
+        # completed from the audio cache), and then just once.
         size_bytes = 0
-        duration_ms = 0
+        duration_ms = job.duration_ms
         if job.audio_file_path and os.path.isfile(job.audio_file_path):
             size_bytes = os.path.getsize(job.audio_file_path)
-            try:
-                with open(job.audio_file_path, "rb") as f:
-                    duration_ms = self._stitcher.get_duration_ms(f.read())
-            except Exception:
-                duration_ms = 0
+            if not duration_ms:
+                try:
+                    with open(job.audio_file_path, "rb") as f:
+                        duration_ms = self._stitcher.get_duration_ms(f.read())
+                    job.duration_ms = duration_ms
+                except Exception:
+                    duration_ms = 0
 
         timing = job.timing_data or TimingData(
             timing_type="sentence", words=None, sentences=[]
@@ -9,15 +9,18 @@ from dataclasses import dataclass, field
 from datetime import datetime
 
 from src.api.schemas import GenerationStatus, ProviderName, TimingData
+from src.processing.chunker import TextChunk
 
 
-@dataclass
+@dataclass(slots=True)
 class GenerationJob:
     """
     Internal job tracking object. Stored in-memory.
 
     This is NOT a Pydantic model -- it is a plain dataclass used
-    internally by the job store and job manager.
+    internally by the job store and job manager. slots=True drops the
+    per-instance __dict__, shrinking each job and making the frequent
+    status/progress mutations slot-offset writes.
     """
 
     id: str
@@ -34,3 +37,20 @@ class GenerationJob:
     error_message: str | None
     created_at: datetime
     completed_at: datetime | None
+
+    # Duration of the final audio, recorded at completion so metadata
+    # requests don't have to re-decode the MP3. 0 = unknown (e.g., jobs
+    # completed from the audio cache); resolved lazily on first read.
+    duration_ms: int = 0
+
+    # Chunk plan computed during create_job and reused by process_job, so
+    # the sentence-splitting pass over the text runs once per job.
+    chunks: list[TextChunk] | None = field(default=None, repr=False)
+
+    # Status serialization cache. status_version is bumped by the job
+    # manager on every mutation; the API layer stores the last rendered
+    # JSON bytes alongside the version it was built from, so steady-state
+    # polls skip re-serializing an unchanged status.
+    status_version: int = 0
+    cached_status_json: bytes | None = field(default=None, repr=False)
+    cached_status_version: int = field(default=-1, repr=False)
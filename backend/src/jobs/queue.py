@@ -0,0 +1,90 @@
+"""
+Bounded in-process work queue for TTS generation jobs.
+
+Decouples job execution from the HTTP request lifecycle: handlers enqueue
+a job ID and return immediately, while a fixed pool of worker tasks drains
+the queue. This keeps the event loop responsive under concurrent load and
+bounds how many provider pipelines run at once.
+"""
+
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKER_COUNT = 2
+
+# How long stop() waits for cancelled workers to unwind before giving up,
+# so a wedged provider call cannot stall container shutdown indefinitely.
+SHUTDOWN_TIMEOUT_S = 5.0
+
+
+class JobQueue:
+    """
+    Asyncio work queue that processes generation jobs on a worker pool.
+
+    Jobs are submitted by ID and processed by JobManager.process_job.
+    Worker tasks run for the lifetime of the application and are
+    cancelled on shutdown.
+    """
+
+    def __init__(self, job_manager, worker_count: int = DEFAULT_WORKER_COUNT) -> None:
+        """
+        Args:
+            job_manager: JobManager used to process submitted jobs.
+            worker_count: Number of concurrent worker tasks.
+        """
+        if worker_count < 1:
+            raise ValueError("worker_count must be at least 1")
+        self._manager = job_manager
+        self._worker_count = worker_count
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+        self._workers: list[asyncio.Task] = []
+
+    async def start(self) -> None:
+        """Spawn the worker task pool. Idempotent."""
+        if self._workers:
+            return
+        self._workers = [
+            asyncio.create_task(self._worker(i), name=f"job-queue-worker-{i}")
+            for i in range(self._worker_count)
+        ]
+        logger.info("Job queue started with %d workers", self._worker_count)
+
+    async def stop(self) -> None:
+        """Cancel all worker tasks and wait (bounded) for them to finish."""
+        if not self._workers:
+            return
+        for worker in self._workers:
+            worker.cancel()
+        _, pending = await asyncio.wait(self._workers, timeout=SHUTDOWN_TIMEOUT_S)
+        if pending:
+            logger.warning(
+                "%d job queue worker(s) did not stop within %.0fs",
+                len(pending),
+                SHUTDOWN_TIMEOUT_S,
+            )
+        self._workers = []
+        logger.info("Job queue stopped")
+
+    def submit(self, job_id: str) -> None:
+        """Enqueue a job for background processing."""
+        self._queue.put_nowait(job_id)
+
+    @property
+    def pending_count(self) -> int:
+        """Number of jobs waiting in the queue (excluding in-flight)."""
+        return self._queue.qsize()
+
+    async def _worker(self, index: int) -> None:
+        """Worker loop: pull job IDs and process them one at a time."""
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._manager.process_job(job_id)
+            except Exception:
+                # process_job catches its own errors; this guards against
+                # unexpected failures (e.g., job store lookup) killing the worker.
+                logger.exception("Job queue worker %d failed on job %s", index, job_id)
+            finally:
+                self._queue.task_done()
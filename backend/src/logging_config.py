@@ -5,22 +5,39 @@ In production (LOG_FORMAT=json), emits JSON-structured log lines.
 In development (LOG_FORMAT=text, the default), uses human-readable format.
 """
 
-import json
 import logging
 import os
 import re
 import sys
 from datetime import datetime, timezone
 
+import orjson
+
+# Bound once; format() runs per log record and skips the module + class
+# attribute lookups this way.
+_UTC = timezone.utc
+_fromtimestamp = datetime.fromtimestamp
+
 
 class KeyRedactingFilter(logging.Filter):
     """Redact potential API keys from log messages."""
 
     KEY_PATTERN = re.compile(r"[A-Za-z0-9_\-]{20,}")
 
+    # A key-like token is at least this long; shorter messages cannot
+    # contain one and skip the regex entirely.
+    _MIN_TOKEN_LENGTH = 20
+
     def filter(self, record: logging.LogRecord) -> bool:
-        if isinstance(record.msg, str):
-            record.msg = self.KEY_PATTERN.sub("[REDACTED]", record.msg)
+        msg = record.msg
+        if not isinstance(msg, str) or len(msg) < self._MIN_TOKEN_LENGTH:
+            return True
+        # A record may pass through several handlers, each running this
+        # filter; scan it once and mark it done.
+        if getattr(record, "_key_redacted", False):
+            return True
+        record.msg = self.KEY_PATTERN.sub("[REDACTED]", msg)
+        record._key_redacted = True
         return True
 
 
@@ -32,8 +49,10 @@ class JSONFormatter(logging.Formatter):
     """
 
     def format(self, record: logging.LogRecord) -> str:
+        # orjson serializes the datetime natively (RFC 3339), so no
+        # isoformat() call per record; the whole entry is encoded in C.
         log_entry = {
-            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "timestamp": _fromtimestamp(record.created, tz=_UTC),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -51,7 +70,7 @@ class JSONFormatter(logging.Formatter):
                 "traceback": self.formatException(record.exc_info),
             }
 
-        return json.dumps(log_entry, default=str)
+        return orjson.dumps(log_entry, default=str, option=orjson.OPT_UTC_Z).decode()
 
 
 def configure_logging() -> None:
@@ -5,27 +5,30 @@ Configures the app, registers error handlers, sets up structured logging,
 request ID middleware, and graceful shutdown via SIGTERM.
 """
 
-import asyncio
 import logging
-import signal
-import sys
+import os
 
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
 
-from fastapi import FastAPI, Request
-from fastapi.responses import FileResponse, JSONResponse
+import orjson
+
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import FileResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from src.api.router import api_router
 from src.config import RuntimeConfig, Settings
-from src.errors import AppError, sanitize_provider_error
+from src.errors import INTERNAL_ERROR_BODY, AppError, sanitize_provider_error
 from src.jobs.manager import JobManager, JobStore
+from src.jobs.queue import JobQueue
 from src.logging_config import configure_logging
-from src.middleware import RequestIDMiddleware
+from src.middleware import CatchAllMiddleware, RequestIDMiddleware
 from src.processing.audio import AudioStitcher, AudioStore, check_ffmpeg_available
 from src.processing.chunker import TextChunker
 from src.processing.timing import TimingNormalizer
+from src.providers._http import close_shared_httpx_client
 from src.providers.amazon_polly import AmazonPollyProvider
 from src.providers.elevenlabs import ElevenLabsProvider
 from src.providers.google_tts import GoogleCloudTTSProvider
@@ -48,15 +51,11 @@ async def lifespan(app: FastAPI):
     """
     logger.info("TTS Reader backend starting up")
 
-    # Register SIGTERM handler for graceful shutdown in containers.
-    loop = asyncio.get_running_loop()
-
-    def _handle_sigterm():
-        logger.info("Received SIGTERM, initiating graceful shutdown")
-        sys.exit(0)
-
-    if hasattr(signal, "SIGTERM"):
-        loop.add_signal_handler(signal.SIGTERM, _handle_sigterm)
+    # SIGTERM is deliberately left to the ASGI server: uvicorn's own
+    # handler stops accepting connections, drains in-flight requests, and
+    # then runs this lifespan's shutdown phase, which cancels the job
+    # queue workers. Installing our own handler here would replace
+    # uvicorn's and skip that sequence.
 
     # --- Initialize all application dependencies ---
 
@@ -93,12 +92,17 @@ async def lifespan(app: FastAPI):
         audio_storage_dir=settings.audio_storage_dir,
     )
 
+    # Background job queue (decouples synthesis from HTTP handlers)
+    job_queue = JobQueue(job_manager, worker_count=settings.job_queue_workers)
+    await job_queue.start()
+
     # Attach to app state for use by API endpoints
     app.state.settings = settings
     app.state.runtime_config = runtime_config
     app.state.provider_registry = registry
     app.state.job_manager = job_manager
     app.state.audio_store = audio_store
+    app.state.job_queue = job_queue
 
     configured = [
         p.name.value for p in registry.list_providers() if p.is_configured
@@ -109,10 +113,19 @@ async def lifespan(app: FastAPI):
     yield
 
     # Shutdown phase
+    await job_queue.stop()
+    await close_shared_httpx_client()
     logger.info("TTS Reader backend shutting down gracefully")
 
 
-app = FastAPI(title="TTS Reader", lifespan=lifespan)
+# ORJSONResponse serializes response dicts with orjson (C implementation),
+# which is markedly faster than the stdlib json encoder on hot endpoints
+# like status polling.
+app = FastAPI(title="TTS Reader", lifespan=lifespan, default_response_class=ORJSONResponse)
+
+# Catch-all sits just inside RequestIDMiddleware so failed requests are
+# still tagged and timed; both are pure ASGI (no BaseHTTPMiddleware cost).
+app.add_middleware(CatchAllMiddleware)
 
 # Add request ID and timing middleware (outermost = runs first)
 app.add_middleware(RequestIDMiddleware)
@@ -127,6 +140,26 @@ if _frontend_dist.is_dir():
     # Mount static assets (JS, CSS, images)
     app.mount("/assets", StaticFiles(directory=str(_frontend_dist / "assets")), name="static")
 
+    # _frontend_dist is already absolute (built from __file__.resolve()),
+    # so traversal can be gated with a pure-string normpath + prefix check
+    # instead of Path.resolve(), which stats every path component.
+    _dist_root = str(_frontend_dist)
+    _index_path = os.path.join(_dist_root, "index.html")
+
+    @lru_cache(maxsize=256)
+    def _resolve_spa_path(full_path: str) -> str:
+        """Map a request path to a file under dist, or index.html.
+
+        Cached: the built dist directory never changes while the server
+        is running, so each distinct route pays the isfile() stat once.
+        """
+        candidate = os.path.normpath(os.path.join(_dist_root, full_path))
+        if not candidate.startswith(_dist_root + os.sep):
+            return _index_path
+        if os.path.isfile(candidate):
+            return candidate
+        return _index_path
+
     @app.get("/{full_path:path}")
     async def serve_spa(full_path: str):
         """
@@ -135,21 +168,17 @@ if _frontend_dist.is_dir():
         This enables client-side routing: all paths not matched by /api/*
         or /assets/* return index.html, and the React router handles them.
         """
-        file_path = (_frontend_dist / full_path).resolve()
-        # Prevent path traversal attacks
-        if not str(file_path).startswith(str(_frontend_dist.resolve())):
-            return FileResponse(str(_frontend_dist / "index.html"))
-        if file_path.is_file():
-            return FileResponse(str(file_path))
-        return FileResponse(str(_frontend_dist / "index.html"))
+        return FileResponse(_resolve_spa_path(full_path))
 
 
 @app.exception_handler(AppError)
-async def app_error_handler(request: Request, exc: AppError) -> JSONResponse:
+async def app_error_handler(request: Request, exc: AppError) -> Response:
     """
     Handle all AppError subclasses with structured JSON responses.
 
-    Sanitizes error messages to prevent API key leakage.
+    Sanitizes error messages to prevent API key leakage. The body is
+    encoded with orjson directly rather than going through JSONResponse's
+    stdlib encoder.
     """
     sanitized_message = sanitize_provider_error(exc.message)
     sanitized_details = exc.details
@@ -159,52 +188,32 @@ async def app_error_handler(request: Request, exc: AppError) -> JSONResponse:
             for k, v in sanitized_details.items()
         }
 
-    return JSONResponse(
+    return Response(
+        content=orjson.dumps(
+            {
+                "error_code": exc.error_code,
+                "message": sanitized_message,
+                "details": sanitized_details,
+            }
+        ),
         status_code=exc.http_status,
-        content={
-            "error_code": exc.error_code,
-            "message": sanitized_message,
-            "details": sanitized_details,
-        },
+        media_type="application/json",
     )
 
 
 @app.exception_handler(Exception)
-async def unhandled_error_handler(request: Request, exc: Exception) -> JSONResponse:
+async def unhandled_error_handler(request: Request, exc: Exception) -> Response:
     """
     Handle unhandled exceptions with a generic error response.
 
-    Logs the full exception for debugging but returns a safe
-    generic message to the client (never exposes internals).
+    Logs the full exception for debugging but returns a safe generic
+    message to the client (never exposes internals). The payload is
+    constant, so it is served from bytes serialized once at import time.
     """
     logger.exception("Unhandled exception")
 
-    return JSONResponse(
+    return Response(
+        content=INTERNAL_ERROR_BODY,
         status_code=500,
-        content={
-            "error_code": "INTERNAL_ERROR",
-            "message": "An unexpected error occurred",
-            "details": None,
-        },
+        media_type="application/json",
     )
-
-
-@app.middleware("http")
-async def catch_unhandled_middleware(request: Request, call_next):
-    """
-    Middleware to catch unhandled exceptions that bypass FastAPI's
-    exception handlers (e.g., RuntimeError in newer Starlette versions).
-    """
-    try:
-        response = await call_next(request)
-        return response
-    except Exception:
-        logger.exception("Unhandled exception in middleware")
-        return JSONResponse(
-            status_code=500,
-            content={
-                "error_code": "INTERNAL_ERROR",
-                "message": "An unexpected error occurred",
-                "details": None,
-            },
-        )
@@ -4,67 +4,142 @@ HTTP middleware for the TTS Reader backend.
 Provides:
   - RequestIDMiddleware: Assigns a unique request ID to each request
     and includes it in the response headers. Also logs request timing.
+  - CatchAllMiddleware: Last-resort handler that turns exceptions escaping
+    the application (including other middleware) into a structured 500.
 """
 
 import logging
 import time
-import uuid
+from secrets import token_hex
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
+from src.errors import INTERNAL_ERROR_BODY
 
 logger = logging.getLogger(__name__)
 
+_INTERNAL_ERROR_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(INTERNAL_ERROR_BODY)).encode("latin-1")),
+]
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+
+class CatchAllMiddleware:
+    """
+    Catch exceptions that bypass FastAPI's exception handlers (e.g., errors
+    raised inside other middleware) and respond with a generic 500.
+
+    Pure ASGI: no per-request task group or stream, and the response body is
+    pre-serialized module-level bytes. If the response has already started
+    the exception is re-raised, since a 500 can no longer be sent.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_tracking_start(message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_tracking_start)
+        except Exception:
+            logger.exception("Unhandled exception")
+            if response_started:
+                raise
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 500,
+                    "headers": list(_INTERNAL_ERROR_HEADERS),
+                }
+            )
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": INTERNAL_ERROR_BODY,
+                }
+            )
+
+
+class RequestIDMiddleware:
     """
     Assigns a unique X-Request-ID to every request.
 
     If the incoming request already has an X-Request-ID header (e.g., from a
-    reverse proxy), it is preserved. Otherwise, a new UUID is generated.
+    reverse proxy), it is preserved. Otherwise, a new 32-char hex ID is
+    generated.
 
     The request ID is:
       - Added to the response headers
-      - Injected into the logging context for correlation
+      - Stored in scope["state"] for access in route handlers
       - Used to log request duration
+
+    Implemented as pure ASGI rather than BaseHTTPMiddleware, which wraps
+    every request in an anyio task group plus a memory stream; this runs
+    inline on the existing task with no extra allocations.
     """
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        # Use existing request ID or generate a new one
-        request_id = request.headers.get("x-request-id", str(uuid.uuid4()))
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")
+                break
+        if not request_id:
+            request_id = token_hex(16)
 
-        # Store on request state for access in route handlers
-        request.state.request_id = request_id
+        # Request.state reads from scope["state"]
+        scope.setdefault("state", {})["request_id"] = request_id
 
-        start_time = time.monotonic()
+        method = scope["method"]
+        path = scope["path"]
+        status_code = 0
+
+        async def send_with_request_id(message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"].append((b"x-request-id", request_id.encode("latin-1")))
+            await send(message)
+
+        start_ns = time.perf_counter_ns()
 
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send_with_request_id)
         except Exception:
-            duration_ms = (time.monotonic() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             logger.exception(
-                "Request failed: %s %s [%s] %.1fms",
-                request.method,
-                request.url.path,
+                "Request failed: %s %s [%s] %dms",
+                method,
+                path,
                 request_id,
                 duration_ms,
             )
             raise
 
-        duration_ms = (time.monotonic() - start_time) * 1000
-
-        response.headers["X-Request-ID"] = request_id
-
         # Log the request (skip health checks to reduce noise)
-        if request.url.path != "/api/health":
+        if path != "/api/health":
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             logger.info(
-                "%s %s -> %d [%s] %.1fms",
-                request.method,
-                request.url.path,
-                response.status_code,
+                "%s %s -> %d [%s] %dms",
+                method,
+                path,
+                status_code,
                 request_id,
                 duration_ms,
             )
-
-        return response
@@ -8,11 +8,15 @@ and manages temporary audio files on disk.
 import logging
 import os
 import shutil
+import subprocess
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from io import BytesIO
 
 from src.errors import AudioProcessingError
+from src.processing.mp3 import MP3ParseError, iter_frames, mp3_duration_ms, strip_tags
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +46,9 @@ class AudioStitcher:
         """
         self.crossfade_ms = crossfade_ms
         self.silence_between_ms = silence_between_ms
+        # Pre-encoded silent MP3 frames keyed by (sample_rate, channels),
+        # generated once per format and reused as inter-chunk gaps.
+        self._silence_cache: dict[tuple[int, int], bytes] = {}
 
     def stitch(self, audio_chunks: list[bytes]) -> StitchResult:
         """
@@ -56,36 +63,249 @@ class AudioStitcher:
         Raises:
             AudioProcessingError: If any chunk is invalid or stitching fails.
         """
-        from pydub import AudioSegment
-
         if len(audio_chunks) == 0:
             raise AudioProcessingError("No audio chunks to stitch")
 
+        fast = self._try_concat_frames(audio_chunks)
+        if fast is not None:
+            audio_bytes, duration_ms = fast
+            return StitchResult(
+                audio_bytes=audio_bytes,
+                duration_ms=duration_ms,
+                size_bytes=len(audio_bytes),
+            )
+
         try:
-            if len(audio_chunks) == 1:
-                segment = AudioSegment.from_mp3(BytesIO(audio_chunks[0]))
-                return self._export_as_mp3(segment)
+            return self._export_as_mp3(
+                self._join_segments(self._decode_chunks(audio_chunks))
+            )
+        except AudioProcessingError:
+            raise
+        except Exception as exc:
+            raise AudioProcessingError(str(exc)) from exc
 
-            combined = AudioSegment.from_mp3(BytesIO(audio_chunks[0]))
+    def stitch_to_file(self, audio_chunks: list[bytes], out_path: str) -> StitchResult:
+        """
+        Combine MP3 chunks and encode the result straight to a file.
 
-            for chunk_bytes in audio_chunks[1:]:
-                segment = AudioSegment.from_mp3(BytesIO(chunk_bytes))
+        Unlike stitch(), the final MP3 is written by the encoder directly
+        to out_path and never materialized in memory, so peak usage for
+        long jobs is bounded by the decoded PCM rather than PCM plus the
+        encoded output. The returned StitchResult carries empty
+        audio_bytes; duration and size describe the written file.
 
-                if self.silence_between_ms > 0:
-                    silence = AudioSegment.silent(duration=self.silence_between_ms)
-                    combined = combined + silence
+        Raises:
+            AudioProcessingError: If any chunk is invalid or stitching fails.
+        """
+        if len(audio_chunks) == 0:
+            raise AudioProcessingError("No audio chunks to stitch")
 
-                if self.crossfade_ms > 0:
-                    combined = combined.append(segment, crossfade=self.crossfade_ms)
-                else:
-                    combined = combined + segment
+        fast = self._try_concat_frames(audio_chunks)
+        if fast is not None:
+            audio_bytes, duration_ms = fast
+            with open(out_path, "wb") as f:
+                f.write(audio_bytes)
+            return StitchResult(
+                audio_bytes=b"",
+                duration_ms=duration_ms,
+                size_bytes=len(audio_bytes),
+            )
 
-            return self._export_as_mp3(combined)
+        try:
+            combined = self._join_segments(self._decode_chunks(audio_chunks))
+            with open(out_path, "wb") as f:
+                combined.export(f, format="mp3", bitrate="192k")
+            return StitchResult(
+                audio_bytes=b"",
+                duration_ms=len(combined),
+                size_bytes=os.path.getsize(out_path),
+            )
         except AudioProcessingError:
             raise
         except Exception as exc:
             raise AudioProcessingError(str(exc)) from exc
 
+    def _decode_chunks(self, audio_chunks: list[bytes]) -> list:
+        """
+        Decode MP3 chunks to AudioSegments, in parallel for multi-chunk jobs.
+
+        Each from_mp3 call blocks on an ffmpeg subprocess with the GIL
+        released, so a thread pool decodes chunks near-linearly up to CPU
+        count instead of paying one subprocess round trip at a time.
+        """
+        if len(audio_chunks) <= 1:
+            return [self._decode_mp3(b) for b in audio_chunks]
+
+        max_workers = min(8, os.cpu_count() or 1, len(audio_chunks))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(self._decode_mp3, audio_chunks))
+
+    def _decode_mp3(self, data: bytes):
+        """
+        Decode one MP3 byte string to an AudioSegment.
+
+        Streams the bytes through ffmpeg via pipes at the source's own
+        sample rate and channel count (read from the first frame header),
+        wrapping the raw PCM in an AudioSegment directly. pydub's
+        from_mp3 instead writes the input to a temp file, transcodes to a
+        WAV temp file, and parses that back in -- two disk round trips
+        and an extra copy per chunk. Falls back to from_mp3 if the stream
+        cannot be parsed or ffmpeg fails.
+        """
+        from pydub import AudioSegment
+
+        try:
+            frame = next(iter_frames(strip_tags(data)))
+            proc = subprocess.run(
+                [
+                    AudioSegment.converter,
+                    "-hide_banner",
+                    "-i", "pipe:0",
+                    "-f", "s16le",
+                    "-ar", str(frame.sample_rate),
+                    "-ac", str(frame.channels),
+                    "pipe:1",
+                ],
+                input=data,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+            if proc.returncode == 0 and proc.stdout:
+                return AudioSegment(
+                    data=proc.stdout,
+                    sample_width=2,
+                    frame_rate=frame.sample_rate,
+                    channels=frame.channels,
+                )
+        except (MP3ParseError, StopIteration, OSError):
+            pass
+        return AudioSegment.from_mp3(BytesIO(data))
+
+    def _try_concat_frames(self, audio_chunks: list[bytes]) -> tuple[bytes, int] | None:
+        """
+        Fast path: join MP3 chunks by appending raw frames, no transcode.
+
+        Valid only when no crossfade is configured and every chunk is a
+        clean Layer III stream with the same sample rate and channel
+        count. Silence gaps are inserted as pre-encoded silent frames.
+        Returns (mp3_bytes, duration_ms), or None if the fast path does
+        not apply (caller falls back to decode + re-encode).
+
+        Compared to the pydub path this skips one ffmpeg launch per chunk
+        plus the final encode, and never materializes decoded PCM.
+        """
+        if self.crossfade_ms > 0:
+            return None
+        try:
+            streams = [strip_tags(b) for b in audio_chunks]
+            duration_s = 0.0
+            sample_rate: int | None = None
+            channels = 0
+            for stream in streams:
+                for frame in iter_frames(stream):
+                    if sample_rate is None:
+                        sample_rate, channels = frame.sample_rate, frame.channels
+                    elif (frame.sample_rate, frame.channels) != (sample_rate, channels):
+                        raise MP3ParseError("Mixed sample rates or channel counts")
+                    duration_s += frame.duration_s
+            if sample_rate is None:
+                raise MP3ParseError("No MP3 frames found")
+
+            silence = b""
+            if self.silence_between_ms > 0 and len(streams) > 1:
+                silence = self._silence_frames(sample_rate, channels)
+                if silence:
+                    duration_s += (len(streams) - 1) * mp3_duration_ms(silence) / 1000
+
+            buf = bytearray(streams[0])
+            for stream in streams[1:]:
+                buf += silence
+                buf += stream
+            return bytes(buf), round(duration_s * 1000)
+        except MP3ParseError as exc:
+            logger.debug("MP3 frame concat unavailable, falling back to decode: %s", exc)
+            return None
+
+    def _silence_frames(self, sample_rate: int, channels: int) -> bytes:
+        """
+        Silent MP3 frames approximating silence_between_ms, cached per format.
+
+        Encodes one second of silence via pydub (a single ffmpeg launch,
+        amortized over the stitcher's lifetime), picks a frame from the
+        middle of the stream (the first is typically the encoder's
+        Xing/Info header), and repeats it to the closest whole-frame
+        match of the configured gap.
+        """
+        key = (sample_rate, channels)
+        cached = self._silence_cache.get(key)
+        if cached is not None:
+            return cached
+
+        from pydub import AudioSegment
+
+        seg = AudioSegment.silent(duration=1000, frame_rate=sample_rate)
+        if channels != seg.channels:
+            seg = seg.set_channels(channels)
+        buffer = BytesIO()
+        seg.export(buffer, format="mp3")
+        stream = strip_tags(buffer.getvalue())
+        frames = list(iter_frames(stream))
+        template = frames[len(frames) // 2]
+        frame_bytes = stream[template.offset : template.offset + template.length]
+        frame_ms = template.duration_s * 1000
+        repeats = round(self.silence_between_ms / frame_ms) if frame_ms else 0
+        result = frame_bytes * repeats
+        self._silence_cache[key] = result
+        return result
+
+    def _join_segments(self, segments: list):
+        """
+        Join decoded segments in order, with silence gaps between them.
+
+        When all segments share the same PCM parameters and no crossfade
+        is configured, their raw data is appended into one bytearray and
+        a single segment is spawned from it. Pairwise AudioSegment
+        concatenation copies the accumulated buffer on every '+', which
+        is O(total^2) bytes for long jobs.
+        """
+        from pydub import AudioSegment
+
+        if len(segments) == 1:
+            return segments[0]
+
+        first = segments[0]
+        params = (first.frame_rate, first.sample_width, first.channels)
+        uniform = all(
+            (seg.frame_rate, seg.sample_width, seg.channels) == params
+            for seg in segments[1:]
+        )
+
+        if uniform and self.crossfade_ms == 0:
+            silence_bytes = b"\x00" * (
+                int(first.frame_rate * self.silence_between_ms / 1000)
+                * first.frame_width
+            )
+            buf = bytearray(first.raw_data)
+            for seg in segments[1:]:
+                buf += silence_bytes
+                buf += seg.raw_data
+            return first._spawn(bytes(buf))
+
+        # Mixed parameters or crossfade: fall back to pairwise appends,
+        # which resample/sync as needed.
+        combined = first
+        for segment in segments[1:]:
+            if self.silence_between_ms > 0:
+                silence = AudioSegment.silent(duration=self.silence_between_ms)
+                combined = combined + silence
+
+            if self.crossfade_ms > 0:
+                combined = combined.append(segment, crossfade=self.crossfade_ms)
+            else:
+                combined = combined + segment
+
+        return combined
+
     def get_duration_ms(self, audio_bytes: bytes) -> int:
         """
         Get the duration of an MP3 audio file in milliseconds.
@@ -99,14 +319,31 @@ class AudioStitcher:
         Raises:
             AudioProcessingError: If the audio data is invalid.
         """
-        from pydub import AudioSegment
+        # A frame-header scan answers this in microseconds with no
+        # subprocess; decode only if the stream cannot be parsed.
+        try:
+            return mp3_duration_ms(audio_bytes)
+        except MP3ParseError:
+            pass
 
         try:
-            segment = AudioSegment.from_mp3(BytesIO(audio_bytes))
-            return len(segment)
+            return len(self._decode_mp3(audio_bytes))
         except Exception as exc:
             raise AudioProcessingError(f"Cannot read audio duration: {exc}") from exc
 
+    def get_durations_ms(self, audio_chunks: list[bytes]) -> list[int]:
+        """
+        Durations of several MP3 byte strings, in order.
+
+        Each chunk is measured by the frame-header scan (microseconds,
+        no subprocess); chunks that cannot be parsed fall back to a pipe
+        decode individually, so one odd chunk does not force N decodes.
+
+        Raises:
+            AudioProcessingError: If any chunk is unreadable.
+        """
+        return [self.get_duration_ms(chunk) for chunk in audio_chunks]
+
     def _export_as_mp3(self, segment) -> StitchResult:
         """Export an AudioSegment as MP3 and return a StitchResult."""
         buffer = BytesIO()
@@ -135,6 +372,27 @@ class AudioStore:
         """
         self._storage_dir = storage_dir
         os.makedirs(storage_dir, exist_ok=True)
+        # Files ordered oldest-first by mtime, so cleanup pops an expired
+        # prefix instead of sweeping the whole directory. The directory's
+        # own mtime detects files written behind the store's back (the
+        # job manager writes stitched output directly) and triggers a
+        # rebuild.
+        self._index: OrderedDict[str, float] = OrderedDict()
+        self._index_dir_mtime_ns = -1
+        self._refresh_index()
+
+    def _refresh_index(self) -> None:
+        """Rebuild the mtime index with one scandir pass, oldest first."""
+        entries: list[tuple[float, str]] = []
+        with os.scandir(self._storage_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".mp3") and entry.is_file(
+                    follow_symlinks=False
+                ):
+                    entries.append((entry.stat().st_mtime, entry.path))
+        entries.sort()
+        self._index = OrderedDict((path, mtime) for mtime, path in entries)
+        self._index_dir_mtime_ns = os.stat(self._storage_dir).st_mtime_ns
 
     def save(self, job_id: str, audio_bytes: bytes) -> str:
         """
@@ -148,9 +406,21 @@ class AudioStore:
             Absolute file path to the saved file.
         """
         file_path = os.path.join(self._storage_dir, f"{job_id}.mp3")
-        with open(file_path, "wb") as f:
+        # Write to a sibling .tmp and rename into place: a crash mid-write
+        # can no longer leave a truncated .mp3 that get_path would serve.
+        # buffering=0: the payload is one ready-made bytes object, so a raw
+        # FileIO write hands it to the kernel in a single syscall without
+        # allocating BufferedWriter's intermediate buffer.
+        tmp_path = file_path + ".tmp"
+        with open(tmp_path, "wb", buffering=0) as f:
             f.write(audio_bytes)
-        return os.path.abspath(file_path)
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+        abs_path = os.path.abspath(file_path)
+        self._index.pop(abs_path, None)
+        self._index[abs_path] = time.time()
+        self._index_dir_mtime_ns = os.stat(self._storage_dir).st_mtime_ns
+        return abs_path
 
     def get_path(self, job_id: str) -> str:
         """
@@ -174,6 +444,8 @@ class AudioStore:
         file_path = os.path.join(self._storage_dir, f"{job_id}.mp3")
         if os.path.isfile(file_path):
             os.remove(file_path)
+            self._index.pop(os.path.abspath(file_path), None)
+            self._index_dir_mtime_ns = os.stat(self._storage_dir).st_mtime_ns
             return True
         return False
 
@@ -184,16 +456,39 @@ class AudioStore:
         Returns:
             Number of files deleted.
         """
+        # If the directory changed behind the store's back, fall back to
+        # one scandir rebuild; otherwise the index is authoritative and
+        # this costs a single stat on the directory itself.
+        if os.stat(self._storage_dir).st_mtime_ns != self._index_dir_mtime_ns:
+            self._refresh_index()
+
         cutoff = time.time() - (hours * 3600)
         removed = 0
 
-        for filename in os.listdir(self._storage_dir):
-            file_path = os.path.join(self._storage_dir, filename)
-            if os.path.isfile(file_path):
-                mtime = os.path.getmtime(file_path)
-                if mtime < cutoff:
-                    os.remove(file_path)
-                    removed += 1
+        # The index is ordered oldest-first, so expired files form a
+        # prefix: pop until the head is fresh enough. Each candidate's
+        # mtime is confirmed with a fresh stat (utime can rewind a file
+        # without touching the directory), so a sweep costs k+1 stats
+        # instead of one per file in the store.
+        while self._index:
+            path = next(iter(self._index))
+            try:
+                mtime = os.stat(path).st_mtime
+            except FileNotFoundError:
+                self._index.popitem(last=False)
+                continue
+            if mtime >= cutoff:
+                self._index[path] = mtime
+                break
+            self._index.popitem(last=False)
+            try:
+                os.remove(path)
+                removed += 1
+            except FileNotFoundError:
+                pass
+
+        if removed:
+            self._index_dir_mtime_ns = os.stat(self._storage_dir).st_mtime_ns
 
         return removed
 
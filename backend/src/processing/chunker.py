@@ -5,8 +5,17 @@ The chunker splits text at natural boundaries (paragraphs, sentences, words)
 while respecting provider character limits and maintaining accurate character offsets.
 """
 
+import re
 from dataclasses import dataclass
 
+# Sentence terminator followed by a space or newline; one compiled scan
+# replaces six separate str.rfind passes over the split window.
+_SENT_BOUNDARY = re.compile(r"[.!?][ \n]")
+
+# Run of whitespace, for jumping the cursor past inter-chunk gaps in one
+# C-level match instead of a per-character Python loop.
+_WS_RUN = re.compile(r"\s+")
+
 
 @dataclass
 class TextChunk:
@@ -51,10 +60,13 @@ class TextChunker:
         if not stripped:
             raise ValueError("Text cannot be empty or whitespace-only")
 
+        # Leading-whitespace offset from two C-level length calls; the
+        # previous text.index(stripped[0]) scanned the document and could
+        # even land on an earlier coincidental match of that character.
+        start_pos = len(text) - len(text.lstrip())
+
         # If the stripped text fits in a single chunk, return immediately
         if len(stripped) <= max_chars:
-            # Find start position of stripped text within original
-            start_pos = text.index(stripped[0]) if stripped else 0
             return [
                 TextChunk(
                     text=stripped,
@@ -65,50 +77,49 @@ class TextChunker:
                 )
             ]
 
+        # Walk the stripped text with a cursor instead of re-slicing the
+        # tail each iteration: remaining[split_pos:] copies the whole
+        # tail, which is O(chars * chunks) for long documents.
         chunks: list[TextChunk] = []
-        remaining = stripped
-        # Account for leading whitespace in the original text
-        offset = text.index(stripped[0]) if stripped else 0
-
-        while remaining:
-            # Strip leading whitespace from remaining
-            remaining_stripped = remaining.lstrip()
-            if remaining_stripped != remaining:
-                consumed_ws = len(remaining) - len(remaining_stripped)
-                offset += consumed_ws
-                remaining = remaining_stripped
-
-            if not remaining:
+        pos = 0
+        end = len(stripped)
+
+        while pos < end:
+            # Skip whitespace at the cursor (left behind by the rstrip
+            # of the previous chunk)
+            ws = _WS_RUN.match(stripped, pos)
+            if ws is not None:
+                pos = ws.end()
+            if pos >= end:
                 break
 
-            if len(remaining) <= max_chars:
-                chunk_text = remaining.rstrip()
+            if end - pos <= max_chars:
+                chunk_text = stripped[pos:].rstrip()
                 chunks.append(
                     TextChunk(
                         text=chunk_text,
-                        start_char=offset,
-                        end_char=offset + len(chunk_text),
+                        start_char=start_pos + pos,
+                        end_char=start_pos + pos + len(chunk_text),
                         chunk_index=len(chunks),
                         total_chunks=0,
                     )
                 )
                 break
 
-            split_pos = self._find_split_point(remaining, max_chars)
+            split_pos = self._find_split_point(stripped, pos, pos + max_chars)
 
-            chunk_text = remaining[:split_pos].rstrip()
+            chunk_text = stripped[pos:split_pos].rstrip()
             chunks.append(
                 TextChunk(
                     text=chunk_text,
-                    start_char=offset,
-                    end_char=offset + len(chunk_text),
+                    start_char=start_pos + pos,
+                    end_char=start_pos + pos + len(chunk_text),
                     chunk_index=len(chunks),
                     total_chunks=0,
                 )
             )
 
-            offset += split_pos
-            remaining = remaining[split_pos:]
+            pos = split_pos
 
         # Set total_chunks on all chunks
         total = len(chunks)
@@ -117,36 +128,36 @@ class TextChunker:
 
         return chunks
 
-    def _find_split_point(self, text: str, max_chars: int) -> int:
+    def _find_split_point(self, text: str, start: int, end: int) -> int:
         """
-        Find the best split point within the first max_chars characters.
+        Find the best split point in text[start:end], returned as an
+        absolute index into text.
 
-        Tries paragraph boundary, then sentence boundary, then word boundary.
+        Tries paragraph boundary, then sentence boundary, then word
+        boundary. Searches use str.rfind with explicit bounds, so no
+        window slice is ever allocated.
         """
-        candidate = text[:max_chars]
-        min_pos = int(max_chars * 0.3)
+        min_pos = start + int((end - start) * 0.3)
 
         # Try paragraph boundary (double newline)
-        para_pos = candidate.rfind("\n\n")
+        para_pos = text.rfind("\n\n", start, end)
         if para_pos > min_pos:
             return para_pos + 2
 
-        # Try sentence boundary
+        # Try sentence boundary: keep the rightmost terminator in one
+        # forward scan, starting past min_pos since earlier matches are
+        # rejected anyway.
         best_sentence_pos = -1
-        for pattern in [". ", "! ", "? ", ".\n", "!\n", "?\n"]:
-            pos = candidate.rfind(pattern)
-            if pos > min_pos:
-                candidate_pos = pos + len(pattern)
-                if candidate_pos > best_sentence_pos:
-                    best_sentence_pos = candidate_pos
+        for match in _SENT_BOUNDARY.finditer(text, min_pos + 1, end):
+            best_sentence_pos = match.end()
 
         if best_sentence_pos > min_pos:
             return best_sentence_pos
 
         # Fallback: word boundary
-        word_pos = candidate.rfind(" ")
-        if word_pos > 0:
+        word_pos = text.rfind(" ", start, end)
+        if word_pos > start:
             return word_pos + 1
 
-        # Absolute last resort: split at max_chars
-        return max_chars
+        # Absolute last resort: split at the window edge
+        return end
@@ -0,0 +1,146 @@
+"""
+Minimal MP3 (MPEG Layer III) frame parsing utilities.
+
+Lets the audio pipeline measure durations and concatenate chunks without
+shelling out to ffmpeg: MP3 frames are self-contained, so same-format
+streams can be joined by appending frames, and duration is the sum of
+per-frame durations read from the 4-byte frame headers.
+
+Only Layer III is supported -- every TTS provider in this app returns
+plain MP3. Anything else (or malformed data) raises MP3ParseError so
+callers can fall back to the pydub/ffmpeg path.
+"""
+
+from dataclasses import dataclass
+
+
+class MP3ParseError(ValueError):
+    """Raised when data cannot be parsed as an MP3 frame stream."""
+
+
+# Bitrate tables (kbps) for Layer III, indexed by the 4-bit bitrate field.
+# Index 0 is "free format" and index 15 is invalid; both are rejected.
+_BITRATES_V1_L3 = (
+    0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 0
+)
+_BITRATES_V2_L3 = (
+    0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160, 0
+)
+
+# Sample rate tables (Hz) indexed by the 2-bit sample-rate field.
+_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),  # MPEG-1
+    2: (22050, 24000, 16000),  # MPEG-2
+    0: (11025, 12000, 8000),  # MPEG-2.5
+}
+
+
+@dataclass(slots=True)
+class FrameInfo:
+    """One MP3 frame: byte span plus enough header info for timing."""
+
+    offset: int
+    length: int
+    sample_rate: int
+    samples: int
+    channels: int
+
+    @property
+    def duration_s(self) -> float:
+        return self.samples / self.sample_rate
+
+
+def strip_tags(data: bytes) -> bytes:
+    """
+    Return the frame stream with ID3v2 (head) and ID3v1 (tail) tags removed.
+    """
+    start = 0
+    if data[:3] == b"ID3" and len(data) >= 10:
+        # Bytes 6-9 hold the tag size as a 28-bit syncsafe integer
+        # (7 bits per byte), not counting the 10-byte header itself.
+        size = (
+            ((data[6] & 0x7F) << 21)
+            | ((data[7] & 0x7F) << 14)
+            | ((data[8] & 0x7F) << 7)
+            | (data[9] & 0x7F)
+        )
+        start = 10 + size
+    end = len(data)
+    if end - start >= 128 and data[end - 128 : end - 125] == b"TAG":
+        end -= 128
+    return data[start:end]
+
+
+def _parse_frame_header(data: bytes, pos: int) -> FrameInfo:
+    """Parse the 4-byte frame header at pos. Raises MP3ParseError."""
+    b0, b1, b2, b3 = data[pos : pos + 4]
+    if b0 != 0xFF or (b1 & 0xE0) != 0xE0:
+        raise MP3ParseError(f"No frame sync at byte {pos}")
+
+    version = (b1 >> 3) & 0x03  # 3=MPEG-1, 2=MPEG-2, 0=MPEG-2.5
+    layer = (b1 >> 1) & 0x03  # 1=Layer III
+    if layer != 1 or version == 1:
+        raise MP3ParseError(f"Unsupported MPEG version/layer at byte {pos}")
+
+    bitrate_index = (b2 >> 4) & 0x0F
+    sample_rate_index = (b2 >> 2) & 0x03
+    if sample_rate_index == 3:
+        raise MP3ParseError(f"Invalid sample rate at byte {pos}")
+
+    if version == 3:
+        bitrate_kbps = _BITRATES_V1_L3[bitrate_index]
+        samples = 1152
+        slot_coefficient = 144
+    else:
+        bitrate_kbps = _BITRATES_V2_L3[bitrate_index]
+        samples = 576
+        slot_coefficient = 72
+    if bitrate_kbps == 0:
+        raise MP3ParseError(f"Free/invalid bitrate at byte {pos}")
+
+    sample_rate = _SAMPLE_RATES[version][sample_rate_index]
+    padding = (b2 >> 1) & 0x01
+    length = slot_coefficient * bitrate_kbps * 1000 // sample_rate + padding
+    channels = 1 if (b3 >> 6) & 0x03 == 3 else 2
+    return FrameInfo(
+        offset=pos,
+        length=length,
+        sample_rate=sample_rate,
+        samples=samples,
+        channels=channels,
+    )
+
+
+def iter_frames(data: bytes):
+    """
+    Yield FrameInfo for each frame in a tag-stripped MP3 stream.
+
+    Raises:
+        MP3ParseError: On the first byte run that is not a valid frame.
+    """
+    pos = 0
+    end = len(data)
+    while pos + 4 <= end:
+        frame = _parse_frame_header(data, pos)
+        yield frame
+        pos = frame.offset + frame.length
+    if pos != end:
+        raise MP3ParseError(f"Trailing garbage after byte {pos}")
+
+
+def mp3_duration_ms(data: bytes) -> int:
+    """
+    Duration of an MP3 byte string in milliseconds via frame-header scan.
+
+    Purely arithmetic: no decode, no subprocess. Roughly three orders of
+    magnitude faster than round-tripping through ffmpeg.
+
+    Raises:
+        MP3ParseError: If the data is not a clean Layer III stream.
+    """
+    if not data:
+        raise MP3ParseError("Empty audio data")
+    duration_s = 0.0
+    for frame in iter_frames(strip_tags(data)):
+        duration_s += frame.duration_s
+    return round(duration_s * 1000)
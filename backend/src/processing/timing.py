@@ -10,6 +10,10 @@ import re
 from src.api.schemas import SentenceTiming, WordTiming
 from src.processing.chunker import TextChunk
 
+# Sentence boundary: sentence-ending punctuation followed by whitespace.
+# Compiled once; split_into_sentences runs per chunk on chapter-length text.
+_SENT_SPLIT = re.compile(r"(?<=[.!?])\s+")
+
 
 def split_into_sentences(text: str) -> list[tuple[str, int, int]]:
     """
@@ -17,27 +21,42 @@ def split_into_sentences(text: str) -> list[tuple[str, int, int]]:
 
     Returns list of (sentence_text, start_char, end_char).
 
-    Uses regex to split on sentence-ending punctuation followed by
-    whitespace or end of string.
+    Walks boundary matches with finditer, so offsets come straight from
+    the match spans in one linear pass (re.split plus str.index scans
+    the text again per sentence, which is quadratic in the worst case).
     """
-    pattern = r"(?<=[.!?])\s+"
-    parts = re.split(pattern, text)
-
     result: list[tuple[str, int, int]] = []
-    current_offset = 0
+    prev_end = 0
+
+    for match in _SENT_SPLIT.finditer(text):
+        if prev_end < match.start():
+            result.append((text[prev_end : match.start()], prev_end, match.start()))
+        prev_end = match.end()
 
-    for part in parts:
-        if not part:
-            continue
-        # Find where this part starts in the original text
-        start = text.index(part, current_offset)
-        end = start + len(part)
-        result.append((part, start, end))
-        current_offset = end
+    if prev_end < len(text):
+        result.append((text[prev_end:], prev_end, len(text)))
 
     return result
 
 
+def _chunk_time_offsets(
+    chunk_durations_ms: list[int], silence_between_ms: int
+) -> list[int]:
+    """
+    Cumulative audio-time offset of each chunk in the stitched output.
+
+    Chunk i starts after the durations of chunks 0..i-1 plus one silence
+    gap per preceding chunk. Computed once up front so the merge is a
+    flat pass over the timing entries.
+    """
+    offsets: list[int] = [0] * len(chunk_durations_ms)
+    running = 0
+    for i, duration in enumerate(chunk_durations_ms):
+        offsets[i] = running
+        running += duration + silence_between_ms
+    return offsets
+
+
 class TimingNormalizer:
     """
     Merges per-chunk timing data into document-level timing data.
@@ -50,7 +69,7 @@ class TimingNormalizer:
     def merge_word_timings(
         self,
         chunks: list[TextChunk],
-        chunk_timings: list[list[WordTiming]],
+        chunk_timings: list[list[WordTiming] | None],
         chunk_durations_ms: list[int],
         silence_between_ms: int = 0,
     ) -> list[WordTiming]:
@@ -59,40 +78,44 @@ class TimingNormalizer:
 
         Args:
             chunks: The text chunks (for character offset information).
-            chunk_timings: Word timing data for each chunk.
+            chunk_timings: Word timing data for each chunk; None entries
+                mean the chunk has no data (its duration still advances
+                the cumulative offset).
             chunk_durations_ms: Duration of each audio chunk in milliseconds.
             silence_between_ms: Silence inserted between chunks by the stitcher.
 
         Returns:
             Single list of WordTiming with adjusted offsets.
         """
-        merged: list[WordTiming] = []
-        cumulative_time_ms = 0
-
-        for i, (chunk, timings, duration) in enumerate(
-            zip(chunks, chunk_timings, chunk_durations_ms)
-        ):
-            for wt in timings:
-                merged.append(
-                    WordTiming(
-                        word=wt.word,
-                        start_ms=wt.start_ms + cumulative_time_ms,
-                        end_ms=wt.end_ms + cumulative_time_ms,
-                        start_char=wt.start_char + chunk.start_char,
-                        end_char=wt.end_char + chunk.start_char,
-                    )
-                )
-            cumulative_time_ms += duration
-            # Add silence gap between chunks (not after the last one)
-            if i < len(chunks) - 1:
-                cumulative_time_ms += silence_between_ms
-
-        return merged
+        # Single-chunk jobs need no shifting at all: every offset is zero,
+        # so the provider's list is already document-level.
+        if len(chunks) == 1 and chunks[0].start_char == 0:
+            return list(chunk_timings[0] or ())
+
+        offsets = _chunk_time_offsets(chunk_durations_ms, silence_between_ms)
+
+        # model_construct skips re-validation: the inputs are already
+        # validated WordTiming instances and the shifts are pure integer
+        # adds, so for long texts (thousands of words) this avoids running
+        # the pydantic validator once per word. Bound to a local so the
+        # comprehension loads it without the per-item attribute lookup.
+        construct = WordTiming.model_construct
+        return [
+            construct(
+                word=wt.word,
+                start_ms=wt.start_ms + offset,
+                end_ms=wt.end_ms + offset,
+                start_char=wt.start_char + chunk.start_char,
+                end_char=wt.end_char + chunk.start_char,
+            )
+            for chunk, timings, offset in zip(chunks, chunk_timings, offsets)
+            for wt in timings or ()
+        ]
 
     def merge_sentence_timings(
         self,
         chunks: list[TextChunk],
-        chunk_timings: list[list[SentenceTiming]],
+        chunk_timings: list[list[SentenceTiming] | None],
         chunk_durations_ms: list[int],
         silence_between_ms: int = 0,
     ) -> list[SentenceTiming]:
@@ -101,27 +124,23 @@ class TimingNormalizer:
 
         Same logic as merge_word_timings but for sentence-level data.
         """
-        merged: list[SentenceTiming] = []
-        cumulative_time_ms = 0
-
-        for i, (chunk, timings, duration) in enumerate(
-            zip(chunks, chunk_timings, chunk_durations_ms)
-        ):
-            for st in timings:
-                merged.append(
-                    SentenceTiming(
-                        sentence=st.sentence,
-                        start_ms=st.start_ms + cumulative_time_ms,
-                        end_ms=st.end_ms + cumulative_time_ms,
-                        start_char=st.start_char + chunk.start_char,
-                        end_char=st.end_char + chunk.start_char,
-                    )
-                )
-            cumulative_time_ms += duration
-            if i < len(chunks) - 1:
-                cumulative_time_ms += silence_between_ms
-
-        return merged
+        if len(chunks) == 1 and chunks[0].start_char == 0:
+            return list(chunk_timings[0] or ())
+
+        offsets = _chunk_time_offsets(chunk_durations_ms, silence_between_ms)
+
+        construct = SentenceTiming.model_construct
+        return [
+            construct(
+                sentence=st.sentence,
+                start_ms=st.start_ms + offset,
+                end_ms=st.end_ms + offset,
+                start_char=st.start_char + chunk.start_char,
+                end_char=st.end_char + chunk.start_char,
+            )
+            for chunk, timings, offset in zip(chunks, chunk_timings, offsets)
+            for st in timings or ()
+        ]
 
     def estimate_sentence_timings(
         self,
@@ -146,6 +165,20 @@ class TimingNormalizer:
         if not sentences:
             return []
 
+        # Single-sentence input (common for short UI blurbs) needs no
+        # proportional distribution: the one sentence spans the whole clip.
+        if len(sentences) == 1:
+            sentence_text, start_char, end_char = sentences[0]
+            return [
+                SentenceTiming(
+                    sentence=sentence_text,
+                    start_ms=0,
+                    end_ms=total_duration_ms,
+                    start_char=start_char,
+                    end_char=end_char,
+                )
+            ]
+
         total_chars = sum(len(s[0]) for s in sentences)
         if total_chars == 0:
             return []
@@ -0,0 +1,45 @@
+"""
+Shared async HTTP client for REST-based providers.
+
+ElevenLabs and Google REST requests go through one lazily-built
+httpx.AsyncClient: connections (and their TLS handshakes) are reused
+across providers and requests instead of each provider instance warming
+its own pool. HTTP/2 lets concurrent chunk requests to the same host
+multiplex over a single connection.
+"""
+
+import httpx
+
+# Pool sizing for the shared client. httpx maintains one pool per host
+# internally, so a single client with a large cap serves every provider;
+# small default pools throttle concurrent chunk synthesis.
+DEFAULT_HTTP_POOL_SIZE = 100
+
+# How long idle keepalive connections stay warm between jobs.
+KEEPALIVE_EXPIRY_S = 60.0
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_shared_httpx_client() -> httpx.AsyncClient:
+    """Get (or lazily create) the process-wide async HTTP client."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(60.0, connect=5.0),
+            limits=httpx.Limits(
+                max_connections=DEFAULT_HTTP_POOL_SIZE,
+                max_keepalive_connections=DEFAULT_HTTP_POOL_SIZE,
+                keepalive_expiry=KEEPALIVE_EXPIRY_S,
+            ),
+        )
+    return _client
+
+
+async def close_shared_httpx_client() -> None:
+    """Close the shared client; called once from app shutdown."""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
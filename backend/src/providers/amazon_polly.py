@@ -8,6 +8,10 @@ for async compatibility. Supports word-level timing via speech marks.
 import asyncio
 import json
 import logging
+import os
+import tempfile
+import threading
+import time
 
 from src.api.schemas import ProviderCapabilities, ProviderName, Voice, WordTiming
 from src.config import RuntimeConfig
@@ -17,10 +21,25 @@ from src.errors import (
     ProviderRateLimitError,
     sanitize_provider_error,
 )
+from src.processing.mp3 import MP3ParseError, mp3_duration_ms
 from src.providers.base import SynthesisResult, TTSProvider
 
 logger = logging.getLogger(__name__)
 
+# Capabilities are static; built once instead of per get_capabilities call.
+_CAPABILITIES = ProviderCapabilities(
+    supports_speed_control=True,
+    supports_word_timing=True,
+    min_speed=0.5,
+    max_speed=2.0,
+    default_speed=1.0,
+    max_chunk_chars=2800,
+)
+
+# The Polly voice roster changes rarely; cache it on disk for a day so
+# restarts skip the ~500ms describe_voices round trip.
+_VOICES_CACHE_TTL_S = 24 * 3600
+
 
 class AmazonPollyProvider(TTSProvider):
     """
@@ -38,6 +57,11 @@ class AmazonPollyProvider(TTSProvider):
     def __init__(self, config: RuntimeConfig) -> None:
         self._config = config
         self._voices_cache: list[Voice] | None = None
+        # boto3 client, built lazily and reused across calls; keyed to the
+        # config version so a runtime credential update rebuilds it.
+        self._client = None
+        self._client_version = -1
+        self._client_lock = threading.Lock()
 
     def get_provider_name(self) -> ProviderName:
         """Return the provider name enum value."""
@@ -56,49 +80,93 @@ class AmazonPollyProvider(TTSProvider):
 
     def get_capabilities(self) -> ProviderCapabilities:
         """Return provider capabilities."""
-        return ProviderCapabilities(
-            supports_speed_control=True,
-            supports_word_timing=True,
-            min_speed=0.5,
-            max_speed=2.0,
-            default_speed=1.0,
-            max_chunk_chars=2800,
-        )
+        return _CAPABILITIES
 
     def _get_client(self):
         """
         Get or create the boto3 Polly client.
 
+        Client construction loads service JSON models and builds endpoint
+        resolvers (tens of ms plus large allocations), so the client is
+        built once and cached; boto3 clients are thread-safe for API
+        calls, and reuse keeps the underlying connection pool warm. The
+        cache is invalidated when credentials change at runtime.
+
         This is a separate method to allow easy mocking in tests.
         """
+        version = self._config.version
+        client = self._client
+        if client is not None and self._client_version == version:
+            return client
+
         import boto3
 
-        return boto3.client(
-            "polly",
-            aws_access_key_id=self._config.get_aws_access_key_id(),
-            aws_secret_access_key=self._config.get_aws_secret_access_key(),
-            region_name=self._config.get_aws_region(),
+        with self._client_lock:
+            if self._client is None or self._client_version != version:
+                self._client = boto3.client(
+                    "polly",
+                    aws_access_key_id=self._config.get_aws_access_key_id(),
+                    aws_secret_access_key=self._config.get_aws_secret_access_key(),
+                    region_name=self._config.get_aws_region(),
+                )
+                self._client_version = version
+            return self._client
+
+    def _voices_cache_path(self) -> str:
+        return os.path.join(
+            self._config.get_audio_storage_dir(), ".polly_voices.json"
         )
 
+    def _load_voices_from_disk(self) -> list[dict] | None:
+        """Read the raw voice list from the disk cache, or None if stale/absent."""
+        try:
+            path = self._voices_cache_path()
+            if os.path.getmtime(path) <= time.time() - _VOICES_CACHE_TTL_S:
+                return None
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, list) else None
+        except Exception:
+            return None
+
+    def _store_voices_to_disk(self, raw_voices: list[dict]) -> None:
+        """Persist the raw voice list atomically (tempfile + replace). Best-effort."""
+        try:
+            path = self._voices_cache_path()
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(raw_voices, f)
+            os.replace(tmp, path)
+        except Exception:
+            logger.debug("Could not write Polly voice cache", exc_info=True)
+
     async def list_voices(self) -> list[Voice]:
         """
         Fetch available voices from Amazon Polly.
 
-        Caches results after first successful call.
+        Caches results in memory after the first successful call, and on
+        disk with a 24h TTL so a fresh process skips the network round
+        trip entirely. The voice roster contains no secrets.
         """
         if self._voices_cache is not None:
             return self._voices_cache
 
-        try:
-            client = self._get_client()
-            response = await asyncio.to_thread(client.describe_voices)
-        except Exception as exc:
-            error_msg = str(exc)
-            self._handle_boto_error(exc)
-            raise ProviderAPIError("amazon", sanitize_provider_error(error_msg)) from exc
+        raw_voices = await asyncio.to_thread(self._load_voices_from_disk)
+        if raw_voices is None:
+            try:
+                client = self._get_client()
+                response = await asyncio.to_thread(client.describe_voices)
+            except Exception as exc:
+                error_msg = str(exc)
+                self._handle_boto_error(exc)
+                raise ProviderAPIError(
+                    "amazon", sanitize_provider_error(error_msg)
+                ) from exc
+            raw_voices = response.get("Voices", [])
+            await asyncio.to_thread(self._store_voices_to_disk, raw_voices)
 
         voices: list[Voice] = []
-        for voice_data in response.get("Voices", []):
+        for voice_data in raw_voices:
             voices.append(
                 Voice(
                     voice_id=voice_data["Id"],
@@ -118,6 +186,7 @@ class AmazonPollyProvider(TTSProvider):
         text: str,
         voice_id: str,
         speed: float = 1.0,
+        need_timings: bool = True,
     ) -> SynthesisResult:
         """
         Synthesize text to speech using Amazon Polly.
@@ -128,52 +197,72 @@ class AmazonPollyProvider(TTSProvider):
         caps = self.get_capabilities()
         speed = max(caps.min_speed, min(caps.max_speed, speed))
 
-        # Wrap text in SSML for speed control
+        # Wrap text in SSML for speed control. The prefix is built
+        # separately so its length is known without searching the SSML
+        # string later (speech-mark offsets are relative to the SSML).
         speed_pct = int(speed * 100)
-        ssml_text = f'<speak><prosody rate="{speed_pct}%">{text}</prosody></speak>'
+        ssml_prefix_str = f'<speak><prosody rate="{speed_pct}%">'
+        ssml_text = ssml_prefix_str + text + "</prosody></speak>"
 
         try:
             client = self._get_client()
 
-            # Get speech marks (timing data)
-            marks_response = await asyncio.to_thread(
-                client.synthesize_speech,
-                Text=ssml_text,
-                TextType="ssml",
-                OutputFormat="json",
-                SpeechMarkTypes=["word"],
-                VoiceId=voice_id,
+            # Speech marks (timing) and audio are independent requests;
+            # issue both at once so the chunk costs one round trip of
+            # wall clock instead of two back-to-back.
+            marks_response, audio_response = await asyncio.gather(
+                asyncio.to_thread(
+                    client.synthesize_speech,
+                    Text=ssml_text,
+                    TextType="ssml",
+                    OutputFormat="json",
+                    SpeechMarkTypes=["word"],
+                    VoiceId=voice_id,
+                ),
+                asyncio.to_thread(
+                    client.synthesize_speech,
+                    Text=ssml_text,
+                    TextType="ssml",
+                    OutputFormat="mp3",
+                    VoiceId=voice_id,
+                ),
             )
 
             marks_data = marks_response["AudioStream"].read().decode("utf-8")
 
-            # Get audio
-            audio_response = await asyncio.to_thread(
-                client.synthesize_speech,
-                Text=ssml_text,
-                TextType="ssml",
-                OutputFormat="mp3",
-                VoiceId=voice_id,
-            )
-
-            audio_bytes = audio_response["AudioStream"].read()
-
-            # Estimate duration from audio
+            # Drain the audio stream in 64 KiB blocks into one growable
+            # buffer instead of a single read(): the streaming body then
+            # never holds its own full-payload copy alongside ours.
+            stream = audio_response["AudioStream"]
+            buf = bytearray()
+            while True:
+                block = stream.read(65536)
+                if not block:
+                    break
+                buf.extend(block)
+            audio_bytes = bytes(buf)
+
+            # Measure duration with a frame-header scan -- a ~ms pass over
+            # the bytes, versus spinning up ffmpeg for a full decode just
+            # to read the length. Falls back to pydub on unparsable data.
             duration_ms = 0
             if audio_bytes:
                 try:
-                    from pydub import AudioSegment
-                    from io import BytesIO
+                    duration_ms = mp3_duration_ms(audio_bytes)
+                except MP3ParseError:
+                    try:
+                        from io import BytesIO
+
+                        from pydub import AudioSegment
 
-                    seg = AudioSegment.from_mp3(BytesIO(audio_bytes))
-                    duration_ms = len(seg)
-                except Exception:
-                    duration_ms = 0
+                        duration_ms = len(AudioSegment.from_mp3(BytesIO(audio_bytes)))
+                    except Exception:
+                        duration_ms = 0
 
             # Parse speech marks
             # Polly returns char offsets relative to the SSML input, not
-            # the original text.  Calculate the prefix length to adjust.
-            ssml_prefix = ssml_text.index(text) if text in ssml_text else 0
+            # the original text; shift them back by the known prefix length.
+            ssml_prefix = len(ssml_prefix_str)
 
             raw_marks: list[dict] = []
             if marks_data.strip():
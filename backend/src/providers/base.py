@@ -5,6 +5,7 @@ All TTS provider implementations must inherit from TTSProvider and
 implement all abstract methods.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
@@ -17,6 +18,22 @@ from src.api.schemas import (
 )
 
 
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parse a Retry-After header value into seconds.
+
+    Only the delta-seconds form is supported; HTTP-date values and
+    garbage return None so callers fall back to their own backoff.
+    """
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        return None
+    return seconds if seconds >= 0 else None
+
+
 @dataclass
 class SynthesisResult:
     """Result of synthesizing a single chunk of text."""
@@ -60,6 +77,7 @@ class TTSProvider(ABC):
         text: str,
         voice_id: str,
         speed: float = 1.0,
+        need_timings: bool = True,
     ) -> SynthesisResult:
         """
         Convert a text chunk to speech.
@@ -68,6 +86,9 @@ class TTSProvider(ABC):
             text: Text to synthesize (already chunked, within provider limits).
             voice_id: The provider-specific voice identifier.
             speed: Speaking rate multiplier (1.0 = normal).
+            need_timings: Whether the caller wants word/sentence timing
+                data. Providers may use False to skip timing-related API
+                work entirely and return timings as None.
 
         Returns:
             SynthesisResult with audio bytes and timing data.
@@ -79,6 +100,41 @@ class TTSProvider(ABC):
         """
         ...
 
+    async def synthesize_many(
+        self,
+        chunks: list[tuple[str, str, float]],
+        concurrency: int = 3,
+    ) -> list[SynthesisResult]:
+        """
+        Synthesize several chunks concurrently.
+
+        All tasks are created up-front and gathered behind a bounded
+        semaphore, so network I/O and TLS overlap across chunks instead
+        of paying one round trip per chunk serially. Results come back
+        in input order.
+
+        Args:
+            chunks: (text, voice_id, speed) tuples, one per chunk.
+            concurrency: Maximum chunks in flight at once.
+
+        Raises:
+            Whatever synthesize raises; the first failure propagates and
+            the remaining tasks are cancelled.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def one(chunk: tuple[str, str, float]) -> SynthesisResult:
+            async with sem:
+                return await self.synthesize(*chunk)
+
+        tasks = [asyncio.create_task(one(chunk)) for chunk in chunks]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
     @abstractmethod
     def get_capabilities(self) -> ProviderCapabilities:
         """
@@ -8,6 +8,7 @@ word-level timestamps, so sentence-level timing is estimated.
 import logging
 
 import httpx
+import orjson
 
 from src.api.schemas import ProviderCapabilities, ProviderName, Voice
 from src.config import RuntimeConfig
@@ -17,12 +18,25 @@ from src.errors import (
     ProviderRateLimitError,
     sanitize_provider_error,
 )
-from src.providers.base import SynthesisResult, TTSProvider
+from src.processing.mp3 import MP3ParseError, mp3_duration_ms
+from src.providers._http import get_shared_httpx_client
+from src.providers.base import SynthesisResult, TTSProvider, parse_retry_after
+from src.providers.throttle import AIMDLimiter
 
 logger = logging.getLogger(__name__)
 
 OPENAI_BASE_URL = "https://api.openai.com"
 
+# Capabilities are static; built once instead of per get_capabilities call.
+_CAPABILITIES = ProviderCapabilities(
+    supports_speed_control=True,
+    supports_word_timing=False,
+    min_speed=0.25,
+    max_speed=4.0,
+    default_speed=1.0,
+    max_chunk_chars=4000,
+)
+
 # OpenAI TTS has a fixed set of voices
 OPENAI_VOICES = [
     ("alloy", "Alloy"),
@@ -33,6 +47,24 @@ OPENAI_VOICES = [
     ("shimmer", "Shimmer"),
 ]
 
+# The roster never changes, so the Voice models are validated once at
+# import instead of six times per /api/voices request.
+# Allowlist for early rejection: an unknown voice_id would only come
+# back as a 4xx after a full TLS round trip.
+_VOICE_IDS: frozenset[str] = frozenset(v for v, _ in OPENAI_VOICES)
+
+_VOICES: tuple[Voice, ...] = tuple(
+    Voice(
+        voice_id=voice_id,
+        name=display_name,
+        language_code="en-US",
+        language_name="English (US)",
+        gender=None,
+        provider=ProviderName.OPENAI,
+    )
+    for voice_id, display_name in OPENAI_VOICES
+)
+
 
 class OpenAITTSProvider(TTSProvider):
     """
@@ -49,7 +81,16 @@ class OpenAITTSProvider(TTSProvider):
 
     def __init__(self, config: RuntimeConfig) -> None:
         self._config = config
-        self._client = httpx.AsyncClient(timeout=60.0)
+        self._client = get_shared_httpx_client()
+        # Adaptive backpressure: halve concurrency on 429/5xx instead of
+        # burning round trips on requests that will be rejected anyway.
+        self._limiter = AIMDLimiter(
+            min_concurrency=1, max_concurrency=8, max_rpm=500
+        )
+        # Authorization string rebuilt only when the key rotates; every
+        # synthesize call reuses the cached value.
+        self._cached_api_key: str | None = None
+        self._cached_auth: str = ""
 
     def get_provider_name(self) -> ProviderName:
         """Return the provider name enum value."""
@@ -65,50 +106,52 @@ class OpenAITTSProvider(TTSProvider):
 
     def get_capabilities(self) -> ProviderCapabilities:
         """Return provider capabilities."""
-        return ProviderCapabilities(
-            supports_speed_control=True,
-            supports_word_timing=False,
-            min_speed=0.25,
-            max_speed=4.0,
-            default_speed=1.0,
-            max_chunk_chars=4000,
-        )
+        return _CAPABILITIES
 
     async def list_voices(self) -> list[Voice]:
         """
         Return the hardcoded list of OpenAI TTS voices.
 
-        OpenAI does not have a dynamic voice listing endpoint.
+        OpenAI does not have a dynamic voice listing endpoint. Returns a
+        fresh list over the prebuilt module-level Voice objects.
         """
-        return [
-            Voice(
-                voice_id=voice_id,
-                name=display_name,
-                language_code="en-US",
-                language_name="English (US)",
-                gender=None,
-                provider=ProviderName.OPENAI,
-            )
-            for voice_id, display_name in OPENAI_VOICES
-        ]
+        return list(_VOICES)
 
     async def synthesize(
         self,
         text: str,
         voice_id: str,
         speed: float = 1.0,
+        need_timings: bool = True,
     ) -> SynthesisResult:
         """
         Synthesize text using the OpenAI TTS API.
 
         Speed is clamped to 0.25-4.0. No word-level timing is available.
+
+        Raises:
+            ProviderAPIError: If voice_id is not a known OpenAI voice,
+                without spending a network round trip on it.
         """
+        if voice_id not in _VOICE_IDS:
+            raise ProviderAPIError("openai", f"unknown voice_id: {voice_id}")
+
         caps = self.get_capabilities()
+        if not caps.min_speed <= speed <= caps.max_speed:
+            logger.warning(
+                "openai: speed %s out of range [%s, %s]; clamping",
+                speed,
+                caps.min_speed,
+                caps.max_speed,
+            )
         speed = max(caps.min_speed, min(caps.max_speed, speed))
 
         api_key = self._config.get_openai_api_key() or ""
+        if api_key != self._cached_api_key:
+            self._cached_auth = f"Bearer {api_key}"
+            self._cached_api_key = api_key
         headers = {
-            "Authorization": f"Bearer {api_key}",
+            "Authorization": self._cached_auth,
             "Content-Type": "application/json",
         }
         payload = {
@@ -119,36 +162,59 @@ class OpenAITTSProvider(TTSProvider):
             "response_format": "mp3",
         }
 
+        # Stream the body into one growable buffer as it arrives instead
+        # of letting httpx buffer it internally and copying it out of
+        # response.content afterwards: peak memory stays at ~1x the audio.
         client = self._client
-        response = await client.post(
+        async with self._limiter.slot(), client.stream(
+            "POST",
             f"{OPENAI_BASE_URL}/v1/audio/speech",
             headers=headers,
-            json=payload,
-        )
-
-        if response.status_code == 401:
-            raise ProviderAuthError("openai")
-        if response.status_code == 429:
-            raise ProviderRateLimitError("openai")
-        if response.status_code != 200:
-            raise ProviderAPIError(
-                "openai",
-                sanitize_provider_error(response.text),
-            )
-
-        audio_bytes = response.content
-
-        # Estimate duration from audio bytes
+            # orjson writes straight to bytes, skipping httpx's stdlib
+            # json.dumps plus the separate utf-8 encode pass.
+            content=orjson.dumps(payload),
+        ) as response:
+            if response.status_code == 401:
+                raise ProviderAuthError("openai")
+            if response.status_code == 429:
+                self._limiter.record_throttle()
+                raise ProviderRateLimitError(
+                    "openai",
+                    retry_after=parse_retry_after(response.headers.get("retry-after")),
+                )
+            if response.status_code != 200:
+                if response.status_code >= 500:
+                    self._limiter.record_throttle()
+                # Error bodies are small; read them for the sanitized message.
+                await response.aread()
+                raise ProviderAPIError(
+                    "openai",
+                    sanitize_provider_error(response.text),
+                )
+
+            self._limiter.record_success()
+            buf = bytearray()
+            async for chunk in response.aiter_bytes(65536):
+                buf.extend(chunk)
+
+        audio_bytes = bytes(buf)
+
+        # Duration from a frame-header scan (microseconds over the bytes)
+        # instead of a full ffmpeg decode; pydub is only a fallback for
+        # data the scanner cannot parse.
         duration_ms = 0
         if audio_bytes:
             try:
-                from pydub import AudioSegment
-                from io import BytesIO
+                duration_ms = mp3_duration_ms(audio_bytes)
+            except MP3ParseError:
+                try:
+                    from io import BytesIO
+
+                    from pydub import AudioSegment
 
-                seg = AudioSegment.from_mp3(BytesIO(audio_bytes))
-                duration_ms = len(seg)
-            except Exception:
-                duration_ms = 0
+                    duration_ms = len(AudioSegment.from_mp3(BytesIO(audio_bytes)))
+                except Exception:
+                    duration_ms = 0
 
         # No word-level timing from OpenAI; sentence estimation done at job level
         return SynthesisResult(
@@ -9,6 +9,10 @@ from src.api.schemas import ProviderCapabilities, ProviderInfo, ProviderName
 from src.errors import ProviderNotFoundError
 from src.providers.base import TTSProvider
 
+# Enum member -> slot index, so lookups are one list index instead of a
+# dict hash of the enum member.
+_ORD = {provider: index for index, provider in enumerate(ProviderName)}
+
 
 class ProviderRegistry:
     """
@@ -18,11 +22,24 @@ class ProviderRegistry:
     """
 
     def __init__(self) -> None:
-        self._providers: dict[ProviderName, TTSProvider] = {}
+        # One slot per ProviderName member, indexed by _ORD.
+        self._providers: list[TTSProvider | None] = [None] * len(_ORD)
+        # Memoized list_providers() result; rebuilt after register() or
+        # an explicit invalidate() (e.g. when an API key changes).
+        self._cached: list[ProviderInfo] | None = None
 
     def register(self, provider: TTSProvider) -> None:
         """Register a provider instance."""
-        self._providers[provider.get_provider_name()] = provider
+        self._providers[_ORD[provider.get_provider_name()]] = provider
+        self._cached = None
+
+    def invalidate(self) -> None:
+        """Drop the memoized provider list.
+
+        Call after anything that can change is_configured, such as a
+        runtime API-key update.
+        """
+        self._cached = None
 
     def get(self, name: ProviderName) -> TTSProvider:
         """
@@ -31,7 +48,8 @@ class ProviderRegistry:
         Raises:
             ProviderNotFoundError: If the provider is not registered.
         """
-        provider = self._providers.get(name)
+        index = _ORD.get(name)
+        provider = self._providers[index] if index is not None else None
         if provider is None:
             raise ProviderNotFoundError(name.value if isinstance(name, ProviderName) else str(name))
         return provider
@@ -40,18 +58,23 @@ class ProviderRegistry:
         """
         List all registered providers with their capabilities and
         configuration status.
+
+        The result is memoized: the registry membership and capabilities
+        are fixed after startup, and is_configured only changes on a key
+        update, which calls invalidate().
         """
-        result: list[ProviderInfo] = []
-        for provider in self._providers.values():
-            result.append(
+        if self._cached is None:
+            self._cached = [
                 ProviderInfo(
                     name=provider.get_provider_name(),
                     display_name=provider.get_display_name(),
                     capabilities=provider.get_capabilities(),
                     is_configured=provider.is_configured(),
                 )
-            )
-        return result
+                for provider in self._providers
+                if provider is not None
+            ]
+        return self._cached
 
     def get_configured_providers(self) -> list[ProviderInfo]:
         """List only providers that have credentials configured."""
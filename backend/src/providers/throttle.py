@@ -0,0 +1,94 @@
+"""
+Adaptive concurrency limiting for provider API calls.
+
+Rate-limited providers return 429 only after a full TLS round trip has
+been spent; the limiter keeps in-flight requests just under the point
+where that starts happening. Concurrency follows AIMD (additive
+increase on success, multiplicative decrease on throttling), and a
+sliding one-minute window caps how many requests may start per minute.
+"""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+
+# Sliding-window length for the requests-per-minute cap.
+_WINDOW_S = 60.0
+
+
+class AIMDLimiter:
+    """
+    Additive-increase / multiplicative-decrease concurrency limiter.
+
+    Each completed call without throttling nudges the allowed
+    concurrency up (one extra slot per window of successes); a 429 or
+    server error halves it immediately, down to a floor of
+    min_concurrency. Not thread-safe: all access is on the event loop,
+    like the rest of the provider layer.
+    """
+
+    def __init__(
+        self,
+        min_concurrency: int = 1,
+        max_concurrency: int = 8,
+        max_rpm: int = 0,
+    ) -> None:
+        """
+        Args:
+            min_concurrency: Floor the limit never drops below.
+            max_concurrency: Ceiling the limit never grows above.
+            max_rpm: Maximum request starts per minute (0 disables).
+        """
+        self._min = min_concurrency
+        self._max = max_concurrency
+        # Start optimistic; the first 429 halves this.
+        self._limit = float(max_concurrency)
+        self._in_flight = 0
+        self._max_rpm = max_rpm
+        self._starts: deque[float] = deque()
+        self._cond = asyncio.Condition()
+
+    @property
+    def concurrency(self) -> int:
+        """Current concurrency limit (floored to an int)."""
+        return max(self._min, int(self._limit))
+
+    @asynccontextmanager
+    async def slot(self):
+        """Hold one in-flight slot for the duration of a request."""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < self.concurrency)
+            self._in_flight += 1
+        try:
+            await self._wait_for_rpm_slot()
+            yield
+        finally:
+            async with self._cond:
+                self._in_flight -= 1
+                self._cond.notify_all()
+
+    async def _wait_for_rpm_slot(self) -> None:
+        """Sleep until the sliding window has room for one more start."""
+        if not self._max_rpm:
+            return
+        while True:
+            now = time.monotonic()
+            while self._starts and now - self._starts[0] >= _WINDOW_S:
+                self._starts.popleft()
+            if len(self._starts) < self._max_rpm:
+                self._starts.append(now)
+                return
+            await asyncio.sleep(self._starts[0] + _WINDOW_S - now)
+
+    def record_success(self) -> None:
+        """Additive increase: one extra slot per `limit` successes."""
+        self._limit = min(float(self._max), self._limit + 1.0 / max(self._limit, 1.0))
+
+    def record_throttle(self) -> None:
+        """Multiplicative decrease after a 429 or server error.
+
+        Waiters re-evaluate the lowered limit the next time a slot is
+        released; in-flight requests are allowed to finish.
+        """
+        self._limit = max(float(self._min), self._limit / 2.0)
@@ -141,3 +141,76 @@ class TestAudioFileEndpoint:
         client = TestClient(app)
         resp = client.get("/api/audio/test-job/file")
         assert resp.status_code == 409
+
+
+class TestAudioFileETag:
+    """Tests for content-hash ETag / 304 revalidation on the file endpoint."""
+
+    def _make_app(self, tmp_path):
+        from src.main import app
+
+        audio_path = tmp_path / "test-job-123.mp3"
+        audio_path.write_bytes(b"\xff\xfb\x90\x00" + b"\x00" * 1024)
+
+        mock_manager = MagicMock()
+        mock_manager.get_audio_file_path.return_value = str(audio_path)
+        app.state.job_manager = mock_manager
+        return TestClient(app)
+
+    def test_audio_file_has_etag(self, tmp_path):
+        client = self._make_app(tmp_path)
+        resp = client.get("/api/audio/test-job-123/file")
+        etag = resp.headers.get("etag", "")
+        assert etag.startswith('"') and etag.endswith('"')
+
+    def test_matching_if_none_match_returns_304(self, tmp_path):
+        client = self._make_app(tmp_path)
+        etag = client.get("/api/audio/test-job-123/file").headers["etag"]
+
+        resp = client.get(
+            "/api/audio/test-job-123/file", headers={"If-None-Match": etag}
+        )
+        assert resp.status_code == 304
+        assert resp.content == b""
+
+    def test_stale_if_none_match_returns_full_file(self, tmp_path):
+        client = self._make_app(tmp_path)
+        resp = client.get(
+            "/api/audio/test-job-123/file", headers={"If-None-Match": '"stale"'}
+        )
+        assert resp.status_code == 200
+        assert len(resp.content) > 0
+
+
+class TestAudioFileCacheHeaders:
+    """Tests for caching and range headers on the file endpoint."""
+
+    def _make_app(self, tmp_path):
+        from src.main import app
+
+        audio_path = tmp_path / "test-job-123.mp3"
+        audio_path.write_bytes(b"\xff\xfb\x90\x00" + b"\x00" * 1024)
+
+        mock_manager = MagicMock()
+        mock_manager.get_audio_file_path.return_value = str(audio_path)
+        app.state.job_manager = mock_manager
+        return TestClient(app)
+
+    def test_audio_file_is_immutable_cacheable(self, tmp_path):
+        client = self._make_app(tmp_path)
+        resp = client.get("/api/audio/test-job-123/file")
+        assert resp.headers.get("cache-control") == "public, max-age=31536000, immutable"
+
+    def test_audio_file_advertises_byte_ranges(self, tmp_path):
+        client = self._make_app(tmp_path)
+        resp = client.get("/api/audio/test-job-123/file")
+        assert resp.headers.get("accept-ranges") == "bytes"
+        assert resp.headers.get("content-length") == str(1028)
+
+    def test_audio_file_serves_range_request(self, tmp_path):
+        client = self._make_app(tmp_path)
+        resp = client.get(
+            "/api/audio/test-job-123/file", headers={"Range": "bytes=0-3"}
+        )
+        assert resp.status_code == 206
+        assert resp.content == b"\xff\xfb\x90\x00"
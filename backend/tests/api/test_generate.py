@@ -190,3 +190,215 @@ class TestGenerateStatusEndpoint:
         resp = client.get("/api/generate/bad-id/status")
         assert resp.status_code == 404
         assert resp.json()["error_code"] == "JOB_NOT_FOUND"
+
+
+class TestGenerateStatusWebSocket:
+    """Tests for WS /api/generate/{job_id}/ws endpoint."""
+
+    def _make_job(self, status="in_progress", progress=0.5):
+        from src.jobs.models import GenerationJob
+        from src.api.schemas import ProviderName, GenerationStatus
+
+        return GenerationJob(
+            id="test-job-123",
+            provider=ProviderName.GOOGLE,
+            voice_id="en-US-Neural2-A",
+            text="Hello world",
+            speed=1.0,
+            status=GenerationStatus(status),
+            progress=progress,
+            total_chunks=2,
+            completed_chunks=1,
+            audio_file_path=None,
+            timing_data=None,
+            error_message=None,
+            created_at=datetime.utcnow(),
+            completed_at=None,
+        )
+
+    def _snapshot(self, status, progress):
+        return {
+            "job_id": "test-job-123",
+            "status": status,
+            "progress": progress,
+            "total_chunks": 2,
+            "completed_chunks": 1,
+            "error_message": None,
+        }
+
+    def test_ws_sends_terminal_status_and_closes(self):
+        import asyncio
+        from src.main import app
+
+        mock_manager = MagicMock()
+        mock_manager.get_job_status.return_value = self._make_job("completed", 1.0)
+        mock_manager.status_snapshot.return_value = self._snapshot("completed", 1.0)
+        mock_manager.subscribe.return_value = asyncio.Queue()
+        app.state.job_manager = mock_manager
+
+        client = TestClient(app)
+        with client.websocket_connect("/api/generate/test-job-123/ws") as ws:
+            data = ws.receive_json()
+            assert data["status"] == "completed"
+        mock_manager.unsubscribe.assert_called_once()
+
+    def test_ws_pushes_subsequent_updates(self):
+        import asyncio
+        from src.main import app
+
+        queue = asyncio.Queue()
+        queue.put_nowait(self._snapshot("completed", 1.0))
+
+        mock_manager = MagicMock()
+        mock_manager.get_job_status.return_value = self._make_job("in_progress", 0.5)
+        mock_manager.status_snapshot.return_value = self._snapshot("in_progress", 0.5)
+        mock_manager.subscribe.return_value = queue
+        app.state.job_manager = mock_manager
+
+        client = TestClient(app)
+        with client.websocket_connect("/api/generate/test-job-123/ws") as ws:
+            first = ws.receive_json()
+            assert first["status"] == "in_progress"
+            second = ws.receive_json()
+            assert second["status"] == "completed"
+
+    def test_ws_unknown_job_closes_with_policy_code(self):
+        from src.main import app
+        from src.errors import JobNotFoundError
+        from starlette.websockets import WebSocketDisconnect
+
+        mock_manager = MagicMock()
+        mock_manager.get_job_status.side_effect = JobNotFoundError("bad-id")
+        app.state.job_manager = mock_manager
+
+        client = TestClient(app)
+        with pytest.raises(WebSocketDisconnect) as exc_info:
+            with client.websocket_connect("/api/generate/bad-id/ws"):
+                pass
+        assert exc_info.value.code == 1008
+
+
+class TestGenerateStatusLongPolling:
+    """Tests for the ?wait= long-polling variant of the status endpoint."""
+
+    def _make_job(self, status="in_progress", progress=0.5):
+        return TestGenerateStatusWebSocket._make_job(self, status, progress)
+
+    def test_wait_ignored_for_terminal_job(self):
+        from src.main import app
+
+        mock_manager = MagicMock()
+        mock_manager.get_job_status.return_value = self._make_job("completed", 1.0)
+        app.state.job_manager = mock_manager
+
+        client = TestClient(app)
+        resp = client.get("/api/generate/test-job-123/status?wait=5")
+        assert resp.status_code == 200
+        assert resp.json()["status"] == "completed"
+        mock_manager.subscribe.assert_not_called()
+
+    def test_wait_returns_updated_status_on_change(self):
+        import asyncio
+        from src.main import app
+
+        queue = asyncio.Queue()
+        queue.put_nowait({"status": "completed"})
+
+        mock_manager = MagicMock()
+        mock_manager.get_job_status.side_effect = [
+            self._make_job("in_progress", 0.5),
+            self._make_job("completed", 1.0),
+        ]
+        mock_manager.subscribe.return_value = queue
+        app.state.job_manager = mock_manager
+
+        client = TestClient(app)
+        resp = client.get("/api/generate/test-job-123/status?wait=5")
+        assert resp.status_code == 200
+        assert resp.json()["status"] == "completed"
+        mock_manager.unsubscribe.assert_called_once()
+
+    def test_wait_times_out_and_returns_current_status(self):
+        import asyncio
+        from src.main import app
+
+        mock_manager = MagicMock()
+        mock_manager.get_job_status.return_value = self._make_job("in_progress", 0.5)
+        mock_manager.subscribe.return_value = asyncio.Queue()
+        app.state.job_manager = mock_manager
+
+        client = TestClient(app)
+        resp = client.get("/api/generate/test-job-123/status?wait=0.1")
+        assert resp.status_code == 200
+        assert resp.json()["status"] == "in_progress"
+
+    def test_wait_out_of_range_rejected(self):
+        from src.main import app
+
+        app.state.job_manager = MagicMock()
+        client = TestClient(app)
+        resp = client.get("/api/generate/test-job-123/status?wait=120")
+        assert resp.status_code == 422
+
+
+class TestStatusRenderCache:
+    """Tests for the per-job serialized status cache."""
+
+    def _make_job(self):
+        from src.jobs.models import GenerationJob
+        from src.api.schemas import ProviderName, GenerationStatus
+
+        return GenerationJob(
+            id="test-job-123",
+            provider=ProviderName.GOOGLE,
+            voice_id="en-US-Neural2-A",
+            text="Hello world",
+            speed=1.0,
+            status=GenerationStatus.IN_PROGRESS,
+            progress=0.5,
+            total_chunks=2,
+            completed_chunks=1,
+            audio_file_path=None,
+            timing_data=None,
+            error_message=None,
+            created_at=datetime.utcnow(),
+            completed_at=None,
+        )
+
+    def test_render_status_shape(self):
+        import json
+        from src.api.generate import _render_status
+
+        payload = json.loads(_render_status(self._make_job()))
+        assert payload == {
+            "job_id": "test-job-123",
+            "status": "in_progress",
+            "progress": 0.5,
+            "total_chunks": 2,
+            "completed_chunks": 1,
+            "error_message": None,
+        }
+
+    def test_render_status_reuses_bytes_for_unchanged_version(self):
+        from src.api.generate import _render_status
+
+        job = self._make_job()
+        first = _render_status(job)
+        second = _render_status(job)
+        assert second is first
+
+    def test_render_status_rebuilds_after_version_bump(self):
+        import json
+        from src.api.generate import _render_status
+        from src.api.schemas import GenerationStatus
+
+        job = self._make_job()
+        _render_status(job)
+
+        job.status = GenerationStatus.COMPLETED
+        job.progress = 1.0
+        job.status_version += 1
+
+        payload = json.loads(_render_status(job))
+        assert payload["status"] == "completed"
+        assert payload["progress"] == 1.0
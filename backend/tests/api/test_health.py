@@ -10,6 +10,7 @@ from unittest.mock import patch
 import pytest
 from fastapi.testclient import TestClient
 
+from src.api import health
 from src.main import app
 
 
@@ -19,6 +20,14 @@ def client():
     return TestClient(app)
 
 
+@pytest.fixture(autouse=True)
+def _fresh_ffmpeg_cache():
+    """The ffmpeg PATH check is TTL-cached; reset it around every test."""
+    health._ffmpeg_cache = None
+    yield
+    health._ffmpeg_cache = None
+
+
 class TestHealthEndpoint:
     """Tests for GET /api/health."""
 
@@ -68,3 +77,27 @@ class TestHealthEndpoint:
             assert data["status"] == "degraded"
             assert data["dependencies"]["ffmpeg"]["available"] is False
             assert data["dependencies"]["ffmpeg"]["path"] is None
+
+    def test_ffmpeg_check_is_cached_within_ttl(self, client):
+        """The PATH lookup should run once while the TTL has not expired."""
+        with patch(
+            "src.api.health.shutil.which", return_value="/usr/bin/ffmpeg"
+        ) as mock_which:
+            client.get("/api/health")
+            client.get("/api/health")
+            assert mock_which.call_count == 1
+
+    def test_ffmpeg_check_refreshes_after_ttl(self, client):
+        """An expired cache entry should trigger a new PATH lookup."""
+        with patch(
+            "src.api.health.shutil.which", return_value="/usr/bin/ffmpeg"
+        ) as mock_which:
+            client.get("/api/health")
+            # Age the cached entry past the TTL
+            cached_at, result = health._ffmpeg_cache
+            health._ffmpeg_cache = (
+                cached_at - health.FFMPEG_CHECK_TTL_SECONDS - 1,
+                result,
+            )
+            client.get("/api/health")
+            assert mock_which.call_count == 2
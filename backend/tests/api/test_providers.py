@@ -77,3 +77,24 @@ class TestProvidersEndpoint:
         resp = client.get("/api/providers")
         data = resp.json()
         assert data["providers"] == []
+
+    def test_providers_response_cached_for_same_config(self):
+        """Repeat requests should not re-walk the registry."""
+        client = self._make_app()
+        from src.main import app
+
+        client.get("/api/providers")
+        client.get("/api/providers")
+        assert app.state.provider_registry.list_providers.call_count == 1
+
+    def test_providers_cache_invalidated_by_config_version(self):
+        """A runtime-config version bump should rebuild the response."""
+        client = self._make_app()
+        from src.main import app
+
+        app.state.runtime_config = MagicMock()
+        app.state.runtime_config.version = 0
+        client.get("/api/providers")
+        app.state.runtime_config.version = 1
+        client.get("/api/providers")
+        assert app.state.provider_registry.list_providers.call_count == 2
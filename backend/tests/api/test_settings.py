@@ -161,3 +161,28 @@ class TestErrorHandler:
         # Must not leak stack trace
         assert "RuntimeError" not in data["message"]
         assert "unexpected crash" not in data["message"]
+
+
+class TestSettingsResponseCache:
+    """Tests for the version-keyed /api/settings response cache."""
+
+    def test_settings_cached_until_key_update(self):
+        from src.main import app
+        from src.config import RuntimeConfig, Settings
+
+        config = RuntimeConfig(Settings(_env_file=None))
+        app.state.runtime_config = config
+        client = TestClient(app)
+
+        first = client.get("/api/settings").json()
+        google = next(p for p in first["providers"] if p["provider"] == "google")
+        assert google["is_configured"] is False
+
+        client.put(
+            "/api/settings",
+            json={"provider": "google", "api_key": "test-key-123"},
+        )
+
+        second = client.get("/api/settings").json()
+        google = next(p for p in second["providers"] if p["provider"] == "google")
+        assert google["is_configured"] is True
@@ -93,6 +93,23 @@ class TestJobStore:
         assert removed == 1
         assert len(store.list_jobs()) == 1
 
+    def test_cleanup_out_of_order_insertion(self):
+        from src.jobs.manager import JobStore
+
+        store = JobStore()
+        recent_job = self._make_job("recent-job")
+        store.create(recent_job)
+
+        # Inserted after the recent job but older; the time index must
+        # still expire it.
+        old_job = self._make_job("old-job")
+        old_job.created_at = datetime.utcnow() - timedelta(hours=48)
+        store.create(old_job)
+
+        assert store.cleanup_old_jobs(max_age_hours=24) == 1
+        assert store.cleanup_old_jobs(max_age_hours=24) == 0
+        assert [j.id for j in store.list_jobs()] == ["recent-job"]
+
 
 class TestJobManager:
     """Tests for the JobManager orchestration class."""
@@ -394,3 +411,378 @@ class TestRetryLogic:
 
         # Should only be called once (no retries)
         assert provider.synthesize.call_count == 1
+
+
+class TestJobStatusSubscriptions:
+    """Tests for JobManager status subscriptions (WebSocket push support)."""
+
+    _make_manager = TestJobManager._make_manager
+    _make_mock_provider = TestJobManager._make_mock_provider
+
+    @pytest.mark.asyncio
+    async def test_subscriber_receives_status_transitions(self, tmp_audio_dir):
+        from src.api.schemas import GenerateRequest, ProviderName
+
+        provider = self._make_mock_provider()
+        manager = self._make_manager(provider, tmp_audio_dir)
+
+        request = GenerateRequest(
+            provider=ProviderName.GOOGLE,
+            voice_id="en-US-Neural2-A",
+            text="Hello world",
+        )
+        job = await manager.create_job(request)
+        queue = manager.subscribe(job.id)
+        await manager.process_job(job.id)
+
+        snapshots = []
+        while not queue.empty():
+            snapshots.append(queue.get_nowait())
+
+        assert snapshots[0]["status"] == "in_progress"
+        assert snapshots[-1]["status"] == "completed"
+        assert snapshots[-1]["progress"] == 1.0
+        manager.unsubscribe(job.id, queue)
+
+    @pytest.mark.asyncio
+    async def test_subscribe_unknown_job_raises(self, tmp_audio_dir):
+        from src.errors import JobNotFoundError
+
+        manager = self._make_manager(None, tmp_audio_dir)
+        with pytest.raises(JobNotFoundError):
+            manager.subscribe("nonexistent")
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_stops_delivery(self, tmp_audio_dir):
+        from src.api.schemas import GenerateRequest, ProviderName
+
+        provider = self._make_mock_provider()
+        manager = self._make_manager(provider, tmp_audio_dir)
+
+        request = GenerateRequest(
+            provider=ProviderName.GOOGLE,
+            voice_id="en-US-Neural2-A",
+            text="Hello world",
+        )
+        job = await manager.create_job(request)
+        queue = manager.subscribe(job.id)
+        manager.unsubscribe(job.id, queue)
+        await manager.process_job(job.id)
+
+        assert queue.empty()
+
+
+class TestAudioCache:
+    """Tests for the content-addressed audio cache in JobManager."""
+
+    _make_manager = TestJobManager._make_manager
+    _make_mock_provider = TestJobManager._make_mock_provider
+
+    def _request(self, text="Hello world"):
+        from src.api.schemas import GenerateRequest, ProviderName
+
+        return GenerateRequest(
+            provider=ProviderName.GOOGLE,
+            voice_id="en-US-Neural2-A",
+            text=text,
+        )
+
+    @pytest.mark.asyncio
+    async def test_identical_request_served_from_cache(self, tmp_audio_dir):
+        from src.api.schemas import GenerationStatus
+
+        provider = self._make_mock_provider()
+        manager = self._make_manager(provider, tmp_audio_dir)
+
+        first = await manager.create_job(self._request())
+        await manager.process_job(first.id)
+        calls_after_first = provider.synthesize.await_count
+
+        second = await manager.create_job(self._request())
+        await manager.process_job(second.id)
+
+        assert provider.synthesize.await_count == calls_after_first
+        cached_job = manager.get_job_status(second.id)
+        assert cached_job.status == GenerationStatus.COMPLETED
+        assert cached_job.audio_file_path is not None
+        assert cached_job.timing_data is not None
+
+    @pytest.mark.asyncio
+    async def test_different_text_misses_cache(self, tmp_audio_dir):
+        provider = self._make_mock_provider()
+        manager = self._make_manager(provider, tmp_audio_dir)
+
+        first = await manager.create_job(self._request("Hello world"))
+        await manager.process_job(first.id)
+        calls_after_first = provider.synthesize.await_count
+
+        second = await manager.create_job(self._request("Goodbye world"))
+        await manager.process_job(second.id)
+
+        assert provider.synthesize.await_count > calls_after_first
+
+
+class TestConcurrentSynthesis:
+    """Tests for concurrent per-chunk synthesis in process_job."""
+
+    _make_manager = TestJobManager._make_manager
+    _make_mock_provider = TestJobManager._make_mock_provider
+
+    @pytest.mark.asyncio
+    async def test_chunks_synthesized_concurrently_within_bound(self, tmp_audio_dir):
+        import asyncio
+        from src.api.schemas import GenerateRequest, ProviderName, GenerationStatus
+
+        provider = self._make_mock_provider()
+        base_result = provider.synthesize.return_value
+
+        in_flight = 0
+        peak = 0
+
+        async def slow_synthesize(text, voice_id, speed):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            return base_result
+
+        provider.synthesize = AsyncMock(side_effect=slow_synthesize)
+        manager = self._make_manager(provider, tmp_audio_dir)
+
+        # Long enough to produce several chunks
+        request = GenerateRequest(
+            provider=ProviderName.GOOGLE,
+            voice_id="en-US-Neural2-A",
+            text="Hello world. " * 1500,
+        )
+        job = await manager.create_job(request)
+        await manager.process_job(job.id)
+
+        completed = manager.get_job_status(job.id)
+        assert completed.status == GenerationStatus.COMPLETED
+        assert peak > 1
+        # Bounded by ProviderCapabilities.concurrency (default 4)
+        assert peak <= 4
+
+    @pytest.mark.asyncio
+    async def test_overlapping_jobs_share_one_provider_budget(self, tmp_audio_dir):
+        import asyncio
+        from src.api.schemas import GenerateRequest, ProviderName, GenerationStatus
+
+        provider = self._make_mock_provider()
+        base_result = provider.synthesize.return_value
+
+        in_flight = 0
+        peak = 0
+
+        async def slow_synthesize(text, voice_id, speed):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            return base_result
+
+        provider.synthesize = AsyncMock(side_effect=slow_synthesize)
+        manager = self._make_manager(provider, tmp_audio_dir)
+
+        def request(text):
+            return GenerateRequest(
+                provider=ProviderName.GOOGLE,
+                voice_id="en-US-Neural2-A",
+                text=text,
+            )
+
+        first = await manager.create_job(request("Hello world. " * 1500))
+        second = await manager.create_job(request("Goodbye world. " * 1500))
+        await asyncio.gather(
+            manager.process_job(first.id), manager.process_job(second.id)
+        )
+
+        assert manager.get_job_status(first.id).status == GenerationStatus.COMPLETED
+        assert manager.get_job_status(second.id).status == GenerationStatus.COMPLETED
+        # Two overlapping jobs draw from ONE pooled provider budget
+        # (default 4), not one budget each.
+        assert peak <= 4
+
+
+class TestRetryBackoff:
+    """Tests for jitter and Retry-After handling in synthesize_with_retry."""
+
+    def _provider_failing_once(self, error):
+        from src.providers.base import SynthesisResult
+
+        result = SynthesisResult(
+            audio_bytes=b"audio",
+            word_timings=None,
+            sentence_timings=None,
+            sample_rate=24000,
+            duration_ms=100,
+        )
+        provider = MagicMock()
+        provider.synthesize = AsyncMock(side_effect=[error, result])
+        return provider
+
+    @pytest.mark.asyncio
+    async def test_retry_honors_retry_after_hint(self):
+        from src.jobs.manager import synthesize_with_retry
+        from src.errors import ProviderRateLimitError
+
+        provider = self._provider_failing_once(
+            ProviderRateLimitError("test", retry_after=10.0)
+        )
+
+        with patch("src.jobs.manager.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            await synthesize_with_retry(provider, "Hello", "voice", 1.0)
+
+        (delay,) = sleep.call_args.args
+        # Full jitter around the server hint: 10s +/- 50%
+        assert 5.0 <= delay <= 15.0
+
+    @pytest.mark.asyncio
+    async def test_retry_backoff_is_jittered_and_capped(self):
+        from src.jobs.manager import MAX_BACKOFF_SECONDS, synthesize_with_retry
+        from src.errors import ProviderRateLimitError
+
+        provider = self._provider_failing_once(ProviderRateLimitError("test"))
+
+        with patch("src.jobs.manager.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            await synthesize_with_retry(provider, "Hello", "voice", 1.0)
+
+        (delay,) = sleep.call_args.args
+        assert 0.5 <= delay <= 1.5
+        assert delay <= MAX_BACKOFF_SECONDS
+
+
+class TestProgressFlushCoalescing:
+    """Tests for throttled progress updates during chunk synthesis."""
+
+    _make_manager = TestJobManager._make_manager
+    _make_mock_provider = TestJobManager._make_mock_provider
+
+    @pytest.mark.asyncio
+    async def test_fast_chunks_coalesce_intermediate_updates(self, tmp_audio_dir):
+        from src.api.schemas import GenerateRequest, ProviderName, GenerationStatus
+
+        provider = self._make_mock_provider()
+        manager = self._make_manager(provider, tmp_audio_dir)
+
+        request = GenerateRequest(
+            provider=ProviderName.GOOGLE,
+            voice_id="en-US-Neural2-A",
+            text="Hello world. " * 1500,
+        )
+        job = await manager.create_job(request)
+        await manager.process_job(job.id)
+
+        completed = manager.get_job_status(job.id)
+        assert completed.status == GenerationStatus.COMPLETED
+        assert completed.total_chunks > 2
+        # Instant synthesis finishes well inside the flush interval, so
+        # per-chunk updates collapse: far fewer version bumps than the
+        # one-per-chunk the old code produced (plus lifecycle updates).
+        assert completed.status_version < completed.total_chunks + 3
+
+    @pytest.mark.asyncio
+    async def test_final_progress_always_flushed(self, tmp_audio_dir):
+        from src.api.schemas import GenerateRequest, ProviderName
+
+        provider = self._make_mock_provider()
+        manager = self._make_manager(provider, tmp_audio_dir)
+
+        request = GenerateRequest(
+            provider=ProviderName.GOOGLE,
+            voice_id="en-US-Neural2-A",
+            text="Hello world.",
+        )
+        job = await manager.create_job(request)
+        await manager.process_job(job.id)
+
+        completed = manager.get_job_status(job.id)
+        assert completed.completed_chunks == completed.total_chunks
+        assert completed.progress == 1.0
+
+
+class TestChunkPlanReuse:
+    """Tests for reusing the create_job chunk plan in process_job."""
+
+    _make_manager = TestJobManager._make_manager
+    _make_mock_provider = TestJobManager._make_mock_provider
+
+    @pytest.mark.asyncio
+    async def test_process_job_does_not_rechunk(self, tmp_audio_dir):
+        from src.api.schemas import GenerateRequest, ProviderName, GenerationStatus
+
+        provider = self._make_mock_provider()
+        manager = self._make_manager(provider, tmp_audio_dir)
+
+        request = GenerateRequest(
+            provider=ProviderName.GOOGLE,
+            voice_id="en-US-Neural2-A",
+            text="Hello world. " * 500,
+        )
+        job = await manager.create_job(request)
+        assert job.chunks is not None
+        assert len(job.chunks) == job.total_chunks
+
+        # Re-chunking in process_job would hit this
+        manager._chunker.chunk = MagicMock(
+            side_effect=AssertionError("text was re-chunked")
+        )
+        await manager.process_job(job.id)
+
+        completed = manager.get_job_status(job.id)
+        assert completed.status == GenerationStatus.COMPLETED
+
+
+class TestAudioMetadataDuration:
+    """Tests for the recorded-duration fast path in get_audio_metadata."""
+
+    _make_manager = TestJobManager._make_manager
+    _make_mock_provider = TestJobManager._make_mock_provider
+
+    @pytest.mark.asyncio
+    async def test_metadata_uses_duration_recorded_at_completion(self, tmp_audio_dir):
+        from src.api.schemas import GenerateRequest, ProviderName
+
+        provider = self._make_mock_provider()
+        manager = self._make_manager(provider, tmp_audio_dir)
+
+        request = GenerateRequest(
+            provider=ProviderName.GOOGLE,
+            voice_id="en-US-Neural2-A",
+            text="Hello world",
+        )
+        job = await manager.create_job(request)
+        await manager.process_job(job.id)
+
+        assert manager.get_job_status(job.id).duration_ms > 0
+
+        # The stored duration must be served without re-decoding the file
+        manager._stitcher.get_duration_ms = MagicMock(
+            side_effect=AssertionError("MP3 was re-decoded")
+        )
+        metadata = manager.get_audio_metadata(job.id)
+        assert metadata.duration_ms == manager.get_job_status(job.id).duration_ms
+
+
+class TestJobIDGeneration:
+    """Tests for the time-sortable job ID helper."""
+
+    def test_ids_are_32_char_hex(self):
+        from src.jobs.manager import _new_job_id
+
+        job_id = _new_job_id()
+        assert len(job_id) == 32
+        int(job_id, 16)  # should not raise ValueError
+
+    def test_ids_sort_chronologically(self):
+        import time
+
+        from src.jobs.manager import _new_job_id
+
+        first = _new_job_id()
+        time.sleep(0.002)  # cross a millisecond boundary
+        second = _new_job_id()
+        assert first < second
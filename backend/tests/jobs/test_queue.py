@@ -0,0 +1,81 @@
+# Tests for the in-process JobQueue in backend/src/jobs/queue.py
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+
+class TestJobQueue:
+    """Tests for the bounded in-process job queue."""
+
+    @pytest.mark.asyncio
+    async def test_submitted_job_is_processed(self):
+        from src.jobs.queue import JobQueue
+
+        manager = MagicMock()
+        manager.process_job = AsyncMock()
+        queue = JobQueue(manager, worker_count=1)
+        await queue.start()
+
+        queue.submit("job-1")
+        await asyncio.wait_for(queue._queue.join(), timeout=2.0)
+        await queue.stop()
+
+        manager.process_job.assert_awaited_once_with("job-1")
+
+    @pytest.mark.asyncio
+    async def test_processes_jobs_in_submission_order(self):
+        from src.jobs.queue import JobQueue
+
+        processed: list[str] = []
+
+        async def record(job_id):
+            processed.append(job_id)
+
+        manager = MagicMock()
+        manager.process_job = record
+        queue = JobQueue(manager, worker_count=1)
+        await queue.start()
+
+        for job_id in ["job-1", "job-2", "job-3"]:
+            queue.submit(job_id)
+        await asyncio.wait_for(queue._queue.join(), timeout=2.0)
+        await queue.stop()
+
+        assert processed == ["job-1", "job-2", "job-3"]
+
+    @pytest.mark.asyncio
+    async def test_worker_survives_processing_error(self):
+        from src.jobs.queue import JobQueue
+
+        manager = MagicMock()
+        manager.process_job = AsyncMock(side_effect=[RuntimeError("boom"), None])
+        queue = JobQueue(manager, worker_count=1)
+        await queue.start()
+
+        queue.submit("job-bad")
+        queue.submit("job-good")
+        await asyncio.wait_for(queue._queue.join(), timeout=2.0)
+        await queue.stop()
+
+        assert manager.process_job.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_start_is_idempotent(self):
+        from src.jobs.queue import JobQueue
+
+        manager = MagicMock()
+        manager.process_job = AsyncMock()
+        queue = JobQueue(manager, worker_count=2)
+        await queue.start()
+        workers = list(queue._workers)
+        await queue.start()
+        assert queue._workers == workers
+        await queue.stop()
+
+    def test_invalid_worker_count_raises(self):
+        from src.jobs.queue import JobQueue
+
+        with pytest.raises(ValueError):
+            JobQueue(MagicMock(), worker_count=0)
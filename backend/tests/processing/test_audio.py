@@ -74,6 +74,22 @@ class TestAudioStitcher:
         # Version with silence should be longer
         assert result_with.duration_ms > result_no.duration_ms
 
+    def test_stitch_mixed_sample_rates(self):
+        from pydub.generators import Sine
+        from io import BytesIO
+        from src.processing.audio import AudioStitcher
+
+        def _mp3_at_rate(rate):
+            tone = Sine(440, sample_rate=rate).to_audio_segment(duration=300)
+            buf = BytesIO()
+            tone.export(buf, format="mp3")
+            return buf.getvalue()
+
+        # Differing PCM parameters must take the pairwise sync path
+        stitcher = AudioStitcher(silence_between_ms=0)
+        result = stitcher.stitch([_mp3_at_rate(44100), _mp3_at_rate(22050)])
+        assert result.duration_ms >= 500
+
     def test_stitch_invalid_audio_data_raises(self):
         from src.processing.audio import AudioStitcher
         from src.errors import AudioProcessingError
@@ -219,3 +235,164 @@ class TestStitchResult:
         assert result.audio_bytes == b"data"
         assert result.duration_ms == 1000
         assert result.size_bytes == 4
+
+
+class TestStitchToFile:
+    """Tests for file-target stitching."""
+
+    @pytest.fixture
+    def _make_mp3_bytes(self):
+        def _factory(duration_ms=500):
+            from pydub.generators import Sine
+            from io import BytesIO
+
+            tone = Sine(440).to_audio_segment(duration=duration_ms)
+            buf = BytesIO()
+            tone.export(buf, format="mp3")
+            return buf.getvalue()
+
+        return _factory
+
+    def test_stitch_to_file_writes_output(self, _make_mp3_bytes, tmp_path):
+        from src.processing.audio import AudioStitcher
+
+        out_path = str(tmp_path / "out.mp3")
+        stitcher = AudioStitcher()
+        result = stitcher.stitch_to_file(
+            [_make_mp3_bytes(300), _make_mp3_bytes(300)], out_path
+        )
+
+        import os
+
+        assert os.path.isfile(out_path)
+        assert result.audio_bytes == b""
+        assert result.size_bytes == os.path.getsize(out_path)
+        assert result.duration_ms >= 500
+
+    def test_stitch_to_file_empty_list_raises(self, tmp_path):
+        from src.processing.audio import AudioStitcher
+        from src.errors import AudioProcessingError
+
+        with pytest.raises(AudioProcessingError):
+            AudioStitcher().stitch_to_file([], str(tmp_path / "out.mp3"))
+
+
+class TestFrameConcatFastPath:
+    """Tests for the zero-crossfade raw MP3 frame concatenation path."""
+
+    def _mp3(self, duration_ms=500):
+        from io import BytesIO
+        from pydub.generators import Sine
+
+        tone = Sine(440).to_audio_segment(duration=duration_ms)
+        buf = BytesIO()
+        tone.export(buf, format="mp3")
+        return buf.getvalue()
+
+    def test_fast_path_produces_decodable_mp3(self):
+        from io import BytesIO
+        from pydub import AudioSegment
+        from src.processing.audio import AudioStitcher
+
+        stitcher = AudioStitcher(crossfade_ms=0, silence_between_ms=100)
+        chunks = [self._mp3(500), self._mp3(500), self._mp3(500)]
+
+        result = stitcher._try_concat_frames(chunks)
+        assert result is not None
+        audio_bytes, duration_ms = result
+
+        decoded = AudioSegment.from_mp3(BytesIO(audio_bytes))
+        # 3x500ms + 2x100ms silence; each encoded chunk carries ~50-100ms
+        # of encoder delay/padding frames on top of the nominal duration
+        assert 1700 <= duration_ms < 2100
+        assert abs(len(decoded) - duration_ms) < 200
+
+    def test_fast_path_skipped_with_crossfade(self):
+        from src.processing.audio import AudioStitcher
+
+        stitcher = AudioStitcher(crossfade_ms=50, silence_between_ms=0)
+        assert stitcher._try_concat_frames([self._mp3()]) is None
+
+    def test_fast_path_skipped_for_invalid_data(self):
+        from src.processing.audio import AudioStitcher
+
+        stitcher = AudioStitcher(crossfade_ms=0, silence_between_ms=0)
+        assert stitcher._try_concat_frames([b"not an mp3"]) is None
+
+    def test_stitch_uses_fast_path_without_reencoding(self):
+        from unittest.mock import patch
+        from src.processing.audio import AudioStitcher
+
+        stitcher = AudioStitcher(crossfade_ms=0, silence_between_ms=100)
+        chunks = [self._mp3(300), self._mp3(300)]
+
+        with patch.object(
+            AudioStitcher, "_export_as_mp3", side_effect=AssertionError("re-encoded")
+        ):
+            result = stitcher.stitch(chunks)
+        assert result.duration_ms > 0
+        assert result.size_bytes == len(result.audio_bytes)
+
+
+class TestAudioStoreIndex:
+    """Tests for the mtime index backing cleanup_older_than."""
+
+    def test_externally_written_files_are_cleaned(self, tmp_audio_dir):
+        from src.processing.audio import AudioStore
+
+        store = AudioStore(tmp_audio_dir)
+        # Simulate the job manager writing a file without going through save()
+        path = os.path.join(tmp_audio_dir, "external-job.mp3")
+        with open(path, "wb") as f:
+            f.write(b"data")
+        old_time = time.time() - (25 * 3600)
+        os.utime(path, (old_time, old_time))
+
+        removed = store.cleanup_older_than(hours=24)
+        assert removed == 1
+        assert not os.path.exists(path)
+
+    def test_cleanup_stops_at_first_fresh_file(self, tmp_audio_dir):
+        from src.processing.audio import AudioStore
+
+        store = AudioStore(tmp_audio_dir)
+        old_path = store.save("old-job", b"data")
+        store.save("fresh-job", b"data")
+        old_time = time.time() - (25 * 3600)
+        os.utime(old_path, (old_time, old_time))
+
+        removed = store.cleanup_older_than(hours=24)
+        assert removed == 1
+        with pytest.raises(FileNotFoundError):
+            store.get_path("old-job")
+        store.get_path("fresh-job")  # still present
+
+
+class TestGetDurationsBatch:
+    """Tests for the batch duration helper."""
+
+    def _mp3(self, duration_ms=500):
+        from io import BytesIO
+        from pydub.generators import Sine
+
+        tone = Sine(440).to_audio_segment(duration=duration_ms)
+        buf = BytesIO()
+        tone.export(buf, format="mp3")
+        return buf.getvalue()
+
+    def test_durations_in_order(self):
+        from src.processing.audio import AudioStitcher
+
+        stitcher = AudioStitcher()
+        durations = stitcher.get_durations_ms([self._mp3(300), self._mp3(700)])
+        assert len(durations) == 2
+        assert abs(durations[0] - 300) < 100
+        assert abs(durations[1] - 700) < 100
+
+    def test_invalid_chunk_raises(self):
+        from src.errors import AudioProcessingError
+        from src.processing.audio import AudioStitcher
+
+        stitcher = AudioStitcher()
+        with pytest.raises(AudioProcessingError):
+            stitcher.get_durations_ms([self._mp3(300), b"junk"])
@@ -138,7 +138,11 @@ class TestAmazonPollyProviderSynthesize:
 
         # Mock audio response
         mock_audio_response = {
-            "AudioStream": MagicMock(read=MagicMock(return_value=b"\xff\xfb\x90\x00" + b"\x00" * 512)),
+            # The audio body is drained in blocks; read() returns the
+            # payload then b"" for end-of-stream.
+            "AudioStream": MagicMock(
+                read=MagicMock(side_effect=[b"\xff\xfb\x90\x00" + b"\x00" * 512, b""])
+            ),
         }
 
         # Mock speech marks response (NDJSON)
@@ -170,7 +174,9 @@ class TestAmazonPollyProviderSynthesize:
         provider = AmazonPollyProvider(config)
 
         mock_audio_response = {
-            "AudioStream": MagicMock(read=MagicMock(return_value=b"\xff\xfb\x90\x00" + b"\x00" * 512)),
+            "AudioStream": MagicMock(
+                read=MagicMock(side_effect=[b"\xff\xfb\x90\x00" + b"\x00" * 512, b""])
+            ),
         }
         mock_marks_response = {
             "AudioStream": MagicMock(read=MagicMock(return_value=b"")),
@@ -203,3 +209,105 @@ class TestAmazonPollyProviderSynthesize:
         with patch.object(provider, "_get_client", return_value=mock_client):
             with pytest.raises(ProviderRateLimitError):
                 await provider.synthesize("Hello", "Joanna", 1.0)
+
+
+class TestClientCaching:
+    """Tests for the cached boto3 client."""
+
+    def _make_config(self, version=0):
+        config = MagicMock()
+        config.get_aws_access_key_id.return_value = "AKIA"
+        config.get_aws_secret_access_key.return_value = "secret"
+        config.get_aws_region.return_value = "us-east-1"
+        config.version = version
+        return config
+
+    def test_client_is_built_once(self):
+        from src.providers.amazon_polly import AmazonPollyProvider
+
+        provider = AmazonPollyProvider(self._make_config())
+        with patch("boto3.client") as mock_client:
+            first = provider._get_client()
+            second = provider._get_client()
+        assert first is second
+        assert mock_client.call_count == 1
+
+    def test_client_rebuilt_after_credential_update(self):
+        from src.providers.amazon_polly import AmazonPollyProvider
+
+        config = self._make_config(version=0)
+        provider = AmazonPollyProvider(config)
+        with patch("boto3.client", side_effect=[MagicMock(), MagicMock()]) as mock_client:
+            first = provider._get_client()
+            config.version = 1  # simulate a runtime key update
+            second = provider._get_client()
+        assert first is not second
+        assert mock_client.call_count == 2
+
+
+class TestVoiceDiskCache:
+    """Tests for the on-disk voice list cache."""
+
+    def _make_config(self, storage_dir):
+        config = MagicMock()
+        config.get_aws_access_key_id.return_value = "AKIA"
+        config.get_aws_secret_access_key.return_value = "secret"
+        config.get_aws_region.return_value = "us-east-1"
+        config.get_audio_storage_dir.return_value = storage_dir
+        config.version = 0
+        return config
+
+    @pytest.mark.asyncio
+    async def test_fresh_disk_cache_skips_api(self, tmp_path):
+        from src.providers.amazon_polly import AmazonPollyProvider
+
+        cache_file = tmp_path / ".polly_voices.json"
+        cache_file.write_text(json.dumps([
+            {"Id": "Joanna", "Name": "Joanna", "LanguageCode": "en-US",
+             "LanguageName": "US English", "Gender": "Female"},
+        ]))
+
+        provider = AmazonPollyProvider(self._make_config(str(tmp_path)))
+        provider._get_client = MagicMock(
+            side_effect=AssertionError("API should not be called")
+        )
+        voices = await provider.list_voices()
+        assert len(voices) == 1
+        assert voices[0].voice_id == "Joanna"
+
+    @pytest.mark.asyncio
+    async def test_api_response_is_persisted(self, tmp_path):
+        from src.providers.amazon_polly import AmazonPollyProvider
+
+        provider = AmazonPollyProvider(self._make_config(str(tmp_path)))
+        client = MagicMock()
+        client.describe_voices.return_value = {
+            "Voices": [{"Id": "Matthew", "Name": "Matthew",
+                        "LanguageCode": "en-US", "LanguageName": "US English",
+                        "Gender": "Male"}]
+        }
+        provider._get_client = MagicMock(return_value=client)
+
+        await provider.list_voices()
+        cache_file = tmp_path / ".polly_voices.json"
+        assert cache_file.is_file()
+        assert json.loads(cache_file.read_text())[0]["Id"] == "Matthew"
+
+    @pytest.mark.asyncio
+    async def test_stale_disk_cache_is_ignored(self, tmp_path):
+        import os as _os
+        import time as _time
+        from src.providers.amazon_polly import AmazonPollyProvider
+
+        cache_file = tmp_path / ".polly_voices.json"
+        cache_file.write_text("[]")
+        old = _time.time() - 25 * 3600
+        _os.utime(cache_file, (old, old))
+
+        provider = AmazonPollyProvider(self._make_config(str(tmp_path)))
+        client = MagicMock()
+        client.describe_voices.return_value = {"Voices": []}
+        provider._get_client = MagicMock(return_value=client)
+
+        await provider.list_voices()
+        assert client.describe_voices.called
@@ -1,9 +1,51 @@
 # TDD: Written from spec 03-tts-provider-layer.md
 # Tests for TTSProvider ABC and SynthesisResult in backend/src/providers/base.py
 
+import asyncio
+
 import pytest
 
 
+def _make_stub_provider():
+    """Create a minimal concrete TTSProvider whose synthesize is instrumented."""
+    from src.providers.base import SynthesisResult, TTSProvider
+
+    class StubProvider(TTSProvider):
+        def __init__(self):
+            self.active = 0
+            self.peak = 0
+
+        async def list_voices(self):
+            return []
+
+        async def synthesize(self, text, voice_id, speed=1.0, need_timings=True):
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            await asyncio.sleep(0.01)
+            self.active -= 1
+            return SynthesisResult(
+                audio_bytes=text.encode(),
+                word_timings=None,
+                sentence_timings=None,
+                sample_rate=24000,
+                duration_ms=100,
+            )
+
+        def get_capabilities(self):
+            raise NotImplementedError
+
+        def is_configured(self):
+            return True
+
+        def get_provider_name(self):
+            raise NotImplementedError
+
+        def get_display_name(self):
+            return "Stub"
+
+    return StubProvider()
+
+
 class TestTTSProviderABC:
     """Tests for the TTSProvider abstract base class."""
 
@@ -54,6 +96,26 @@ class TestTTSProviderABC:
             PartialProvider()
 
 
+class TestSynthesizeMany:
+    """Tests for the concurrent batch helper on TTSProvider."""
+
+    @pytest.mark.asyncio
+    async def test_results_come_back_in_input_order(self):
+        provider = _make_stub_provider()
+        chunks = [("one", "v", 1.0), ("two", "v", 1.0), ("three", "v", 1.0)]
+        results = await provider.synthesize_many(chunks)
+        assert [r.audio_bytes for r in results] == [b"one", b"two", b"three"]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        provider = _make_stub_provider()
+        chunks = [(f"chunk-{i}", "v", 1.0) for i in range(6)]
+        await provider.synthesize_many(chunks, concurrency=2)
+        assert provider.peak <= 2
+        # Chunks did overlap rather than run one at a time.
+        assert provider.peak == 2
+
+
 class TestSynthesisResult:
     """Tests for the SynthesisResult dataclass."""
 
@@ -139,6 +139,29 @@ class TestElevenLabsProviderSynthesize:
         assert result.audio_bytes is not None
         assert len(result.audio_bytes) > 0
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_synthesize_without_timings_uses_binary_endpoint(self):
+        from src.providers.elevenlabs import ElevenLabsProvider
+
+        config = MagicMock()
+        config.get_elevenlabs_api_key.return_value = "test-key"
+        provider = ElevenLabsProvider(config)
+
+        # Plain endpoint returns raw MP3 bytes, not JSON
+        route = respx.post("https://api.elevenlabs.io/v1/text-to-speech/voice-abc").mock(
+            return_value=httpx.Response(
+                200,
+                content=b"\xff\xfb\x90\x00" + b"\x00" * 64,
+                headers={"Content-Type": "audio/mpeg"},
+            )
+        )
+
+        result = await provider.synthesize("Hello", "voice-abc", 1.0, need_timings=False)
+        assert route.called
+        assert result.audio_bytes.startswith(b"\xff\xfb")
+        assert result.word_timings is None
+
     @pytest.mark.asyncio
     @respx.mock
     async def test_synthesize_rate_limit(self):
@@ -4,6 +4,7 @@
 import base64
 
 import httpx
+import orjson
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -410,7 +411,7 @@ class TestGoogleCloudTTSProviderSynthesizeREST:
 
         call_kwargs = provider._http_client.post.call_args
         assert call_kwargs.kwargs["headers"]["X-Goog-Api-Key"] == "AIza-test-key"
-        payload = call_kwargs.kwargs["json"]
+        payload = orjson.loads(call_kwargs.kwargs["content"])
         assert payload["input"]["text"] == "Test text"
         assert payload["voice"]["name"] == "en-US-Neural2-A"
         assert payload["voice"]["languageCode"] == "en-US"
@@ -434,7 +435,7 @@ class TestGoogleCloudTTSProviderSynthesizeREST:
         await provider.synthesize("Hello", "en-US-Neural2-A", 10.0)
 
         call_kwargs = provider._http_client.post.call_args
-        payload = call_kwargs.kwargs["json"]
+        payload = orjson.loads(call_kwargs.kwargs["content"])
         assert payload["audioConfig"]["speakingRate"] == 4.0
 
     @pytest.mark.asyncio
@@ -483,7 +484,7 @@ class TestGoogleCloudTTSProviderSynthesizeREST:
 
         # Voice with standard format
         await provider.synthesize("Hallo", "de-DE-Neural2-B", 1.0)
-        payload = provider._http_client.post.call_args.kwargs["json"]
+        payload = orjson.loads(provider._http_client.post.call_args.kwargs["content"])
         assert payload["voice"]["languageCode"] == "de-DE"
 
     @pytest.mark.asyncio
@@ -502,5 +503,5 @@ class TestGoogleCloudTTSProviderSynthesizeREST:
 
         # Voice with no dashes -- falls back to en-US
         await provider.synthesize("Hello", "customvoice", 1.0)
-        payload = provider._http_client.post.call_args.kwargs["json"]
+        payload = orjson.loads(provider._http_client.post.call_args.kwargs["content"])
         assert payload["voice"]["languageCode"] == "en-US"
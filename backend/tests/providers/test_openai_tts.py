@@ -185,6 +185,24 @@ class TestOpenAITTSProviderSynthesize:
         with pytest.raises(ProviderAPIError):
             await provider.synthesize("Hello", "alloy", 1.0)
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_synthesize_rejects_unknown_voice_without_network(self):
+        from src.providers.openai_tts import OpenAITTSProvider
+        from src.errors import ProviderAPIError
+
+        config = MagicMock()
+        config.get_openai_api_key.return_value = "sk-test"
+        provider = OpenAITTSProvider(config)
+
+        route = respx.post("https://api.openai.com/v1/audio/speech").mock(
+            return_value=httpx.Response(200, content=b"\xff\xfb\x90\x00")
+        )
+
+        with pytest.raises(ProviderAPIError):
+            await provider.synthesize("Hello", "not-a-voice", 1.0)
+        assert not route.called
+
     @pytest.mark.asyncio
     @respx.mock
     async def test_synthesize_clamps_speed(self):
@@ -95,6 +95,33 @@ class TestProviderRegistry:
         assert registry.list_providers() == []
         assert registry.get_configured_providers() == []
 
+    def test_list_providers_is_memoized_until_invalidated(self):
+        from src.providers.registry import ProviderRegistry
+
+        registry = ProviderRegistry()
+        provider = _make_mock_provider("google", configured=False)
+        registry.register(provider)
+
+        first = registry.list_providers()
+        assert registry.list_providers() is first
+
+        # A key update flips is_configured; invalidate() forces a rebuild.
+        provider.is_configured.return_value = True
+        registry.invalidate()
+        rebuilt = registry.list_providers()
+        assert rebuilt is not first
+        assert rebuilt[0].is_configured is True
+
+    def test_register_invalidates_cached_list(self):
+        from src.providers.registry import ProviderRegistry
+
+        registry = ProviderRegistry()
+        registry.register(_make_mock_provider("google"))
+        assert len(registry.list_providers()) == 1
+
+        registry.register(_make_mock_provider("openai", display_name="OpenAI TTS"))
+        assert len(registry.list_providers()) == 2
+
     def test_register_overwrites_same_name(self):
         from src.providers.registry import ProviderRegistry
         from src.api.schemas import ProviderName
@@ -0,0 +1,82 @@
+# TDD: Tests for AIMDLimiter in backend/src/providers/throttle.py
+
+import asyncio
+
+import pytest
+
+
+class TestAIMDLimiter:
+    """Tests for the adaptive concurrency limiter."""
+
+    def test_starts_at_max_concurrency(self):
+        from src.providers.throttle import AIMDLimiter
+
+        limiter = AIMDLimiter(min_concurrency=1, max_concurrency=8)
+        assert limiter.concurrency == 8
+
+    def test_throttle_halves_concurrency_down_to_floor(self):
+        from src.providers.throttle import AIMDLimiter
+
+        limiter = AIMDLimiter(min_concurrency=2, max_concurrency=8)
+        limiter.record_throttle()
+        assert limiter.concurrency == 4
+        limiter.record_throttle()
+        assert limiter.concurrency == 2
+        # Floor: never drops below min_concurrency
+        limiter.record_throttle()
+        assert limiter.concurrency == 2
+
+    def test_successes_additively_restore_concurrency(self):
+        from src.providers.throttle import AIMDLimiter
+
+        limiter = AIMDLimiter(min_concurrency=1, max_concurrency=4)
+        limiter.record_throttle()  # 4 -> 2
+        assert limiter.concurrency == 2
+        for _ in range(10):
+            limiter.record_success()
+        assert limiter.concurrency > 2
+        # Ceiling: never grows above max_concurrency
+        for _ in range(100):
+            limiter.record_success()
+        assert limiter.concurrency == 4
+
+    @pytest.mark.asyncio
+    async def test_slot_caps_parallel_holders(self):
+        from src.providers.throttle import AIMDLimiter
+
+        limiter = AIMDLimiter(min_concurrency=1, max_concurrency=2)
+        active = 0
+        peak = 0
+
+        async def work():
+            nonlocal active, peak
+            async with limiter.slot():
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(work() for _ in range(6)))
+        assert peak <= 2
+
+    @pytest.mark.asyncio
+    async def test_rpm_window_delays_excess_starts(self):
+        from src.providers import throttle
+        from src.providers.throttle import AIMDLimiter
+
+        limiter = AIMDLimiter(min_concurrency=1, max_concurrency=4, max_rpm=2)
+        # Shrink the window so the third start only waits a few ms.
+        limiter._starts.clear()
+        original = throttle._WINDOW_S
+        throttle._WINDOW_S = 0.05
+        try:
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            for _ in range(3):
+                async with limiter.slot():
+                    pass
+            elapsed = loop.time() - started
+            # Third start had to wait for the window to roll over.
+            assert elapsed >= 0.04
+        finally:
+            throttle._WINDOW_S = original
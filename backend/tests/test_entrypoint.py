@@ -0,0 +1,31 @@
+# Tests for the runnable server entrypoint in backend/src/__main__.py
+
+import pytest
+
+
+class TestResolveWorkerCount:
+    """Tests for WEB_CONCURRENCY worker-count resolution."""
+
+    def test_defaults_to_single_worker(self, monkeypatch):
+        from src.__main__ import resolve_worker_count
+
+        monkeypatch.delenv("WEB_CONCURRENCY", raising=False)
+        assert resolve_worker_count() == 1
+
+    def test_reads_web_concurrency(self, monkeypatch):
+        from src.__main__ import resolve_worker_count
+
+        monkeypatch.setenv("WEB_CONCURRENCY", "4")
+        assert resolve_worker_count() == 4
+
+    def test_clamps_values_below_one(self, monkeypatch):
+        from src.__main__ import resolve_worker_count
+
+        monkeypatch.setenv("WEB_CONCURRENCY", "0")
+        assert resolve_worker_count() == 1
+
+    def test_ignores_unparseable_values(self, monkeypatch):
+        from src.__main__ import resolve_worker_count
+
+        monkeypatch.setenv("WEB_CONCURRENCY", "many")
+        assert resolve_worker_count() == 1
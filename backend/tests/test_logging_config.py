@@ -148,3 +148,49 @@ class TestConfigureLogging:
         root = logging.getLogger()
         assert root.level == logging.INFO
         assert not isinstance(root.handlers[0].formatter, JSONFormatter)
+
+
+class TestKeyRedactingFilter:
+    """Tests for the API-key redaction filter."""
+
+    def _record(self, msg):
+        import logging
+
+        return logging.LogRecord(
+            name="test", level=logging.INFO, pathname=__file__,
+            lineno=1, msg=msg, args=(), exc_info=None,
+        )
+
+    def test_redacts_key_like_tokens(self):
+        from src.logging_config import KeyRedactingFilter
+
+        record = self._record("auth failed for key sk-ABCDEF1234567890abcdef")
+        KeyRedactingFilter().filter(record)
+        assert "[REDACTED]" in record.msg
+        assert "ABCDEF1234567890" not in record.msg
+
+    def test_short_messages_pass_through_unscanned(self):
+        from src.logging_config import KeyRedactingFilter
+
+        record = self._record("job started")
+        KeyRedactingFilter().filter(record)
+        assert record.msg == "job started"
+        assert not getattr(record, "_key_redacted", False)
+
+    def test_record_scanned_only_once_across_handlers(self):
+        from src.logging_config import KeyRedactingFilter
+
+        record = self._record("key sk-ABCDEF1234567890abcdef leaked")
+        filt = KeyRedactingFilter()
+        filt.filter(record)
+        first = record.msg
+
+        filt.filter(record)
+        assert record.msg == first
+        assert record._key_redacted is True
+
+    def test_non_string_msg_ignored(self):
+        from src.logging_config import KeyRedactingFilter
+
+        record = self._record({"event": "start"})
+        assert KeyRedactingFilter().filter(record) is True
@@ -32,6 +32,18 @@ class TestProviderName:
 
         assert isinstance(ProviderName.GOOGLE, str)
 
+    def test_provider_name_case_insensitive_lookup(self):
+        from src.api.schemas import ProviderName
+
+        assert ProviderName("Google") is ProviderName.GOOGLE
+        assert ProviderName("OPENAI") is ProviderName.OPENAI
+
+    def test_provider_name_non_string_raises(self):
+        from src.api.schemas import ProviderName
+
+        with pytest.raises(ValueError):
+            ProviderName(42)
+
 
 class TestProviderCapabilities:
     """Tests for the ProviderCapabilities model."""
@@ -235,6 +247,17 @@ class TestGenerateRequest:
                 text="",
             )
 
+    def test_generate_request_text_whitespace_only(self):
+        from src.api.schemas import GenerateRequest, ProviderName
+        from pydantic import ValidationError
+
+        with pytest.raises(ValidationError):
+            GenerateRequest(
+                provider=ProviderName.GOOGLE,
+                voice_id="test",
+                text="   \n\t  ",
+            )
+
     def test_generate_request_text_too_long(self):
         from src.api.schemas import GenerateRequest, ProviderName
         from pydantic import ValidationError